@@ -0,0 +1,120 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from scenarios import SCENARIOS, count_elements
+
+# --- RERUN LATENCY BENCHMARK ---
+# Usage:
+#   python benchmarks/bench_reruns.py                    # run and compare with baselines
+#   python benchmarks/bench_reruns.py --update-baseline  # run and store new baselines
+# Baselines are wall times of the machine that recorded them, so baselines.json is
+# not committed: record it on the machine that runs the comparison.
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+DEFAULT_THRESHOLD = 0.20  # fail when a metric is more than 20% worse than its baseline
+
+# Metrics compared against the baseline (all "lower is better")
+COMPARED_METRICS = ("median_rerun_s", "p95_rerun_s", "allocated_kib", "elements")
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_scenario(scenario, scale):
+    samples = []
+
+    def record(at):
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        at.run()
+        seconds = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        samples.append({
+            "seconds": seconds,
+            "allocated": current,
+            "peak": peak,
+            "elements": count_elements(at._tree) - 1,
+        })
+        return at
+
+    tracemalloc.start()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    scenario(record, scale)
+    tracemalloc.stop()
+
+    times = [sample["seconds"] for sample in samples]
+    return {
+        "reruns": len(samples),
+        "median_rerun_s": statistics.median(times),
+        "p95_rerun_s": percentile(times, 95),
+        "max_rerun_s": max(times),
+        "allocated_kib": (samples[-1]["allocated"] - start_memory) / 1024,
+        "peak_kib": max(sample["peak"] for sample in samples) / 1024,
+        "elements": samples[-1]["elements"],
+    }
+
+
+def compare(results, baselines, threshold):
+    regressions = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if not baseline:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = baseline.get(metric), result.get(metric)
+            if old is None or new is None or old <= 0:
+                continue
+            if new > old * (1 + threshold):
+                regressions.append(f"{name}.{metric}: {old:.4g} -> {new:.4g} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rerun latency benchmarks for portfolio.py")
+    parser.add_argument("scenarios", nargs="*", help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the number of interactions per scenario")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed relative regression")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="write results as the new baseline")
+    args = parser.parse_args(argv)
+
+    unknown = sorted(set(args.scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    results = {}
+    for name in args.scenarios or SCENARIOS:
+        results[name] = run_scenario(SCENARIOS[name], args.scale)
+        print(json.dumps({"scenario": name, **results[name]}))
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baselines = json.load(f)
+
+    if args.update_baseline:
+        baselines.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not baselines:
+        print(f"No baseline at {args.baseline}; record one on this machine with --update-baseline", file=sys.stderr)
+        return 0
+
+    regressions = compare(results, baselines, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
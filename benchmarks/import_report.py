@@ -0,0 +1,101 @@
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+# --- COLD-START IMPORT REPORT ---
+# Imports everything portfolio.py imports in a fresh interpreter under
+# `python -X importtime` and reports where the startup time goes.
+# Usage:
+#   python benchmarks/import_report.py                  # top modules, lazy imports on
+#   python benchmarks/import_report.py --eager          # with PORTFOLIO_LAZY_IMPORTS=0
+#   python benchmarks/import_report.py --budget-ms 800  # fail when over budget
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "portfolio.py")
+# Libraries that should only load once a section needs them
+HEAVY_MODULES = ("pandas", "numpy", "pydeck", "pyarrow")
+
+
+def app_imports(path=APP_PATH):
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            names.append(node.module)
+    return list(dict.fromkeys(names))
+
+
+# [(module, self_us, cumulative_us, depth)] from the interpreter's -X importtime output
+def parse_importtime(stderr):
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def measure(modules, eager=False):
+    env = dict(os.environ, PORTFOLIO_LAZY_IMPORTS="0" if eager else "1")
+    code = "; ".join(f"import {name}" for name in modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    rows = parse_importtime(proc.stderr)
+    # Only the app's own top-level imports; interpreter startup (site, encodings) is
+    # not ours. Anything they pull in is nested, and counted, under them.
+    timed = {name: cum / 1000 for name, _, cum, depth in rows if depth == 0 and name in modules}
+    loaded = {name for name, *_ in rows}
+    return {
+        "total_ms": sum(timed.values()),
+        "modules": timed,
+        # Submodules count too: importlib.import_module() does not log the package itself
+        "heavy_loaded": [
+            heavy for heavy in HEAVY_MODULES
+            if any(name == heavy or name.startswith(heavy + ".") for name in loaded)
+        ],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start import report for portfolio.py")
+    parser.add_argument("--eager", action="store_true", help="run with PORTFOLIO_LAZY_IMPORTS=0")
+    parser.add_argument("--repeat", type=int, default=3, help="runs to take the fastest of")
+    parser.add_argument("--top", type=int, default=15, help="modules to list")
+    parser.add_argument("--budget-ms", type=float, help="fail when the total exceeds this")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    modules = app_imports()
+    # The first run warms the OS file cache; keep the fastest
+    report = min((measure(modules, args.eager) for _ in range(max(1, args.repeat))),
+                 key=lambda result: result["total_ms"])
+    report["mode"] = "eager" if args.eager else "lazy"
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Cold-start imports ({report['mode']}): {report['total_ms']:.1f} ms")
+        ranked = sorted(report["modules"].items(), key=lambda item: -item[1])
+        for name, ms in ranked[:args.top]:
+            print(f"  {ms:9.1f} ms  {name}")
+        print(f"Heavy modules loaded at startup: {', '.join(report['heavy_loaded']) or 'none'}")
+
+    if args.budget_ms is not None and report["total_ms"] > args.budget_ms:
+        print(f"OVER BUDGET {report['total_ms']:.1f} ms > {args.budget_ms:.1f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,337 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from bench_reruns import percentile
+
+try:
+    import websockets
+except ImportError:  # older Streamlit serves with Tornado and ships its client instead
+    websockets = None
+    from tornado.websocket import websocket_connect
+
+# --- MULTI-SESSION LOAD TEST ---
+# Starts `streamlit run portfolio.py` on a free local port and drives N concurrent
+# sessions over the same websocket protocol the browser uses. Every session loads
+# the page, switches projects, boosts a skill and logs study sessions; we time each
+# rerun from request to "script finished", count the delta messages it sent and
+# sample the server's resident memory.
+# Usage:
+#   python benchmarks/load_test.py                       # 1, 5, 10 and 25 sessions
+#   python benchmarks/load_test.py --sessions 1,50,100   # custom concurrency levels
+#   python benchmarks/load_test.py --visits 3 --json     # longer runs, JSON lines
+#   python benchmarks/load_test.py --no-fragments        # server with PORTFOLIO_FRAGMENTS=0
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "portfolio.py")
+DEFAULT_SESSIONS = (1, 5, 10, 25)
+STARTUP_TIMEOUT = 60
+RERUN_TIMEOUT = 60
+RSS_SAMPLE_INTERVAL = 0.1
+
+# Interactions per visit, before --scale
+PROJECT_SWITCHES = 3
+BOOSTS = 5
+STUDY_LOG_SUBMITS = 3
+
+FINISHED = {
+    ForwardMsg.FINISHED_SUCCESSFULLY,
+    ForwardMsg.FINISHED_WITH_COMPILE_ERROR,
+    getattr(ForwardMsg, "FINISHED_FRAGMENT_RUN_SUCCESSFULLY", ForwardMsg.FINISHED_SUCCESSFULLY),
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, fragments=True):
+    env = dict(os.environ)
+    env["PORTFOLIO_FRAGMENTS"] = "1" if fragments else "0"
+    # Keep load-test submits and boosts out of the real databases
+    env.setdefault("STUDY_LOG_URL", "memory://")
+    env.setdefault("BOOST_COUNTS_URL", "memory://")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_PATH,
+         "--server.headless", "true",
+         "--server.port", str(port),
+         "--server.address", "127.0.0.1",
+         "--server.enableXsrfProtection", "false",
+         "--browser.gatherUsageStats", "false"],
+        # The app opens img/, content.toml and static/ relative to its own directory
+        cwd=os.path.dirname(APP_PATH), env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as resp:
+                if resp.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError(f"streamlit did not come up on port {port} within {STARTUP_TIMEOUT}s")
+
+
+# Resident set size of a process in MiB (Linux /proc); None elsewhere
+def rss_mib(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+# One browser tab: a websocket plus the widgets of the last render
+class Session:
+    def __init__(self, port):
+        self.url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        self.conn = None
+        self.page_script_hash = ""
+        self.widgets = {}  # widget id -> (element type, proto, fragment id)
+
+    async def connect(self):
+        if websockets is not None:
+            self.conn = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        else:
+            self.conn = await websocket_connect(self.url, subprotocols=["streamlit"])
+
+    async def close(self):
+        if self.conn is None:
+            return
+        if websockets is not None:
+            await self.conn.close()
+        else:
+            self.conn.close()
+
+    async def _send(self, data):
+        if websockets is not None:
+            await self.conn.send(data)
+        else:
+            await self.conn.write_message(data, binary=True)
+
+    # Next message, or None once the server has closed the connection
+    async def _receive(self):
+        if websockets is None:
+            return await self.conn.read_message()
+        try:
+            return await self.conn.recv()
+        except websockets.ConnectionClosed:
+            return None
+
+    async def rerun(self, states=(), fragment_id=""):
+        msg = BackMsg()
+        rerun = msg.rerun_script
+        rerun.query_string = ""
+        rerun.page_script_hash = self.page_script_hash
+        if fragment_id:
+            rerun.fragment_id = fragment_id
+        for widget_id, field, value in states:
+            state = rerun.widget_states.widgets.add()
+            state.id = widget_id
+            setattr(state, field, value)
+        start = time.perf_counter()
+        await self._send(msg.SerializeToString())
+        deltas = await asyncio.wait_for(self._until_finished(), RERUN_TIMEOUT)
+        return time.perf_counter() - start, deltas
+
+    # Reads messages up to the end of the rerun; returns how many deltas it sent
+    async def _until_finished(self):
+        deltas = 0
+        while True:
+            data = await self._receive()
+            if data is None:
+                raise ConnectionError("server closed the session")
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            kind = msg.WhichOneof("type")
+            if kind == "new_session":
+                self.page_script_hash = getattr(msg.new_session, "page_script_hash", "") or self.page_script_hash
+            elif kind == "delta":
+                deltas += 1
+            if kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                element = msg.delta.new_element
+                element_type = element.WhichOneof("type")
+                proto = getattr(element, element_type) if element_type else None
+                if proto is not None and "id" in proto.DESCRIPTOR.fields_by_name and proto.id:
+                    self.widgets[proto.id] = (element_type, proto, getattr(msg.delta, "fragment_id", ""))
+            elif kind == "script_finished" and msg.script_finished in FINISHED:
+                return deltas
+
+    def find(self, element_type, key=None, label_prefix=None):
+        for widget_id, (kind, proto, fragment_id) in self.widgets.items():
+            if kind != element_type:
+                continue
+            # Keyed widget ids end with the user key
+            if key is not None and widget_id.endswith(f"-{key}"):
+                return widget_id, proto, fragment_id
+            if label_prefix is not None and proto.label.startswith(label_prefix):
+                return widget_id, proto, fragment_id
+        raise LookupError(f"no {element_type} with key={key!r} label={label_prefix!r}")
+
+    async def click(self, label_prefix):
+        widget_id, _, fragment_id = self.find("button", label_prefix=label_prefix)
+        return await self.rerun([(widget_id, "trigger_value", True)], fragment_id)
+
+    async def select(self, key, index):
+        widget_id, proto, fragment_id = self.find("selectbox", key=key)
+        options = list(proto.options)
+        # Newer Streamlit sends the selected option itself rather than its index
+        if "raw_value" in proto.DESCRIPTOR.fields_by_name or "accept_new_options" in proto.DESCRIPTOR.fields_by_name:
+            state = (widget_id, "string_value", options[index % len(options)])
+        else:
+            state = (widget_id, "int_value", index % len(options))
+        return await self.rerun([state], fragment_id)
+
+
+# One visitor: open the page, then the same interactions as the rerun benchmarks
+async def visit(port, scale, samples):
+    session = Session(port)
+    await session.connect()
+    try:
+        samples.append(("load", *await session.rerun()))
+        for i in range(max(1, int(PROJECT_SWITCHES * scale))):
+            samples.append(("project_switch", *await session.select("project_selector", i + 1)))
+        for _ in range(max(1, int(BOOSTS * scale))):
+            samples.append(("boost", *await session.click("+5 Boost")))
+        for _ in range(max(1, int(STUDY_LOG_SUBMITS * scale))):
+            samples.append(("study_log_submit", *await session.click("Log Study Session")))
+    finally:
+        await session.close()
+
+
+async def sample_rss(pid, peak, stop):
+    while not stop.is_set():
+        rss = rss_mib(pid)
+        if rss is not None:
+            peak[0] = max(peak[0], rss)
+        try:
+            await asyncio.wait_for(stop.wait(), RSS_SAMPLE_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+# samples: (action, seconds, delta messages) per rerun
+def summarize(samples):
+    seconds = [s for _, s, _ in samples]
+    return {
+        "p50_ms": percentile(seconds, 50) * 1000,
+        "p95_ms": percentile(seconds, 95) * 1000,
+        "p99_ms": percentile(seconds, 99) * 1000,
+        "mean_ms": statistics.mean(seconds) * 1000,
+        "mean_deltas": statistics.mean(d for _, _, d in samples),
+    }
+
+
+async def run_level(proc, port, sessions, visits, scale):
+    samples, errors = [], []
+    idle_rss = rss_mib(proc.pid)
+    peak, stop = [idle_rss or 0.0], asyncio.Event()
+    sampler = asyncio.ensure_future(sample_rss(proc.pid, peak, stop))
+
+    # Worker pool: `sessions` visitors at once, each making `visits` visits in a row
+    async def worker():
+        for _ in range(visits):
+            try:
+                await visit(port, scale, samples)
+            except Exception as exc:  # keep the level going; report failures
+                errors.append(f"{type(exc).__name__}: {exc}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(sessions)))
+    wall = time.perf_counter() - start
+    stop.set()
+    await sampler
+
+    result = {"sessions": sessions, "reruns": len(samples), "errors": len(errors),
+              "wall_s": wall, "throughput_rps": len(samples) / wall if wall else 0.0}
+    if samples:
+        result.update(summarize(samples))
+        result["by_action"] = {
+            action: summarize([sample for sample in samples if sample[0] == action])
+            for action in dict.fromkeys(kind for kind, _, _ in samples)
+        }
+    if idle_rss is not None:
+        result.update({
+            "idle_rss_mib": idle_rss,
+            "peak_rss_mib": peak[0],
+            "rss_per_session_mib": (peak[0] - idle_rss) / sessions,
+        })
+    if errors:
+        result["first_error"] = errors[0]
+    return result
+
+
+def print_level(result):
+    line = (f"{result['sessions']:>5} sessions  {result['reruns']:>6} reruns  "
+            f"{result['throughput_rps']:7.1f} reruns/s")
+    if "p50_ms" in result:
+        line += f"  p50 {result['p50_ms']:7.1f} ms  p95 {result['p95_ms']:7.1f} ms  p99 {result['p99_ms']:7.1f} ms"
+        line += f"  {result['mean_deltas']:5.1f} deltas/rerun"
+    if "peak_rss_mib" in result:
+        line += f"  RSS {result['peak_rss_mib']:7.1f} MiB ({result['rss_per_session_mib']:.2f} MiB/session)"
+    if result["errors"]:
+        line += f"  {result['errors']} errors (first: {result['first_error']})"
+    print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for portfolio.py")
+    parser.add_argument("--sessions", default=",".join(map(str, DEFAULT_SESSIONS)),
+                        help="comma-separated concurrency levels")
+    parser.add_argument("--visits", type=int, default=1, help="visits per concurrent session")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the interactions per visit")
+    parser.add_argument("--port", type=int, help="port for the app (default: a free one)")
+    parser.add_argument("--json", action="store_true", help="print one JSON line per level")
+    parser.add_argument("--no-fragments", action="store_true",
+                        help="run the server with PORTFOLIO_FRAGMENTS=0 (full-page reruns)")
+    parser.add_argument("--by-action", action="store_true", help="also print each action's numbers")
+    args = parser.parse_args(argv)
+
+    try:
+        levels = [int(n) for n in args.sessions.split(",") if n.strip()]
+    except ValueError:
+        parser.error("--sessions must be comma-separated integers")
+    if not levels or min(levels) < 1:
+        parser.error("--sessions needs at least one level of 1 or more")
+
+    port = args.port or free_port()
+    proc = start_server(port, fragments=not args.no_fragments)
+    try:
+        loop = asyncio.new_event_loop()
+        # Warm-up visit so the first level doesn't pay the one-off process caches
+        loop.run_until_complete(visit(port, args.scale, []))
+        failed = False
+        for sessions in levels:
+            result = loop.run_until_complete(run_level(proc, port, sessions, args.visits, args.scale))
+            failed = failed or result["errors"] > 0
+            if args.json:
+                print(json.dumps(result))
+            else:
+                print_level(result)
+                if args.by_action:
+                    for action, numbers in result.get("by_action", {}).items():
+                        print(f"      {action:<18} p50 {numbers['p50_ms']:7.1f} ms  p95 {numbers['p95_ms']:7.1f} ms"
+                              f"  {numbers['mean_deltas']:5.1f} deltas/rerun")
+        loop.close()
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+import os
+
+import streamlit as st
+from streamlit.runtime.caching.cache_resource_api import _resource_caches
+from streamlit.testing.v1 import AppTest
+
+# --- BENCHMARK SCENARIOS ---
+# Each scenario drives portfolio.py headlessly through AppTest. Reruns that
+# should be measured go through `record(at)`, which runs the app and samples it.
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "portfolio.py")
+TIMEOUT = 60
+
+
+def new_app():
+    # Keep benchmark submits and boosts out of the real databases
+    os.environ.setdefault("STUDY_LOG_URL", "memory://")
+    os.environ.setdefault("BOOST_COUNTS_URL", "memory://")
+    return AppTest.from_file(APP_PATH, default_timeout=TIMEOUT)
+
+
+def find_button(at, label_prefix):
+    for button in at.button:
+        if button.label.startswith(label_prefix):
+            return button
+    raise LookupError(f"No button starting with {label_prefix!r}")
+
+
+# Number of Streamlit nodes currently in the rendered tree
+def count_elements(node):
+    children = getattr(node, "children", None) or {}
+    return 1 + sum(count_elements(child) for child in children.values())
+
+
+# Cached resources that live as long as the server process. A first visit to a
+# running server finds them already started, and dropping them would strand the
+# session memory sweeper thread and spill directory (and spilled sessions' state).
+PROCESS_RESOURCES = ("get_session_memory", "get_study_log_store", "get_boost_counter")
+
+
+# Clears st.cache_data and every st.cache_resource entry except PROCESS_RESOURCES.
+# The app's cached functions can't be imported from here, so per-function clearing
+# goes through Streamlit's resource cache registry.
+def clear_page_caches():
+    st.cache_data.clear()
+    with _resource_caches._caches_lock:
+        caches = [cache for caches in _resource_caches._function_caches.values() for cache in caches.values()]
+    for cache in caches:
+        if cache.display_name.rsplit(".", 1)[-1] not in PROCESS_RESOURCES:
+            cache.clear()
+
+
+def cold_load(record, scale=1.0):
+    # Drop the page's caches so this really measures a first visit
+    clear_page_caches()
+    at = new_app()
+    record(at)
+    return at
+
+
+def project_switch(record, scale=1.0):
+    at = new_app()
+    at.run()
+    options = list(at.selectbox(key="project_selector").options)
+    for i in range(max(1, int(20 * scale))):
+        at.selectbox(key="project_selector").select(options[i % len(options)])
+        record(at)
+    return at
+
+
+def boosts(record, scale=1.0):
+    at = new_app()
+    at.run()
+    for _ in range(max(1, int(50 * scale))):
+        find_button(at, "+5 Boost").click()
+        record(at)
+    return at
+
+
+def study_log_submits(record, scale=1.0):
+    at = new_app()
+    at.run()
+    languages = list(at.selectbox(key="log_lang").options)
+    for i in range(max(1, int(1000 * scale))):
+        at.selectbox(key="log_lang").select(languages[i % len(languages)])
+        at.number_input(key="log_duration").set_value(1.5)
+        find_button(at, "Log Study Session").click()
+        record(at)
+    return at
+
+
+SCENARIOS = {
+    "cold_load": cold_load,
+    "project_switch": project_switch,
+    "boosts_50": boosts,
+    "study_log_1000": study_log_submits,
+}
@@ -0,0 +1,172 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from datetime import date
+
+from study_log_store import SQLitePool
+
+# --- GLOBAL BOOST COUNTS ("Most Boosted Today") ---
+# Same URL scheme as the study log:
+#   sqlite:///path/to/file.db   (default; replicas on one host share the file)
+#   memory://                   (process-local)
+DEFAULT_BOOST_COUNTS_URL = "sqlite:///" + os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "boost_counts.db")
+BOOST_COUNTS_URL = os.environ.get("BOOST_COUNTS_URL", DEFAULT_BOOST_COUNTS_URL)
+
+# Clicks are coalesced per (day, language) and written at most once per interval
+FLUSH_INTERVAL = 5.0  # seconds
+# Shared counts are re-read from the backend at most this often
+READ_TTL = 10.0  # seconds
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS boost_counts (
+    day TEXT NOT NULL,
+    language TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (day, language)
+) WITHOUT ROWID;
+"""
+
+
+class SQLiteBoostCountsBackend:
+    def __init__(self, path, pool_size=2):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.pool = SQLitePool(path, pool_size)
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA)
+
+    # counts: {(date, language): clicks}, added in one transaction
+    def add_many(self, counts):
+        with self.pool.connection() as conn, conn:
+            conn.executemany(
+                "INSERT INTO boost_counts (day, language, count) VALUES (?, ?, ?) "
+                "ON CONFLICT (day, language) DO UPDATE SET count = count + excluded.count",
+                [(day.isoformat(), language, n) for (day, language), n in counts.items()],
+            )
+
+    # {language: clicks} for one day, served by the primary key
+    def counts_for(self, day):
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT language, count FROM boost_counts WHERE day = ?", (day.isoformat(),)
+            ).fetchall()
+        return dict(rows)
+
+    def close(self):
+        self.pool.close()
+
+
+class MemoryBoostCountsBackend:
+    def __init__(self):
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def add_many(self, counts):
+        with self._lock:
+            self._counts.update(counts)
+
+    def counts_for(self, day):
+        with self._lock:
+            return {language: n for (d, language), n in self._counts.items() if d == day}
+
+    def close(self):
+        pass
+
+
+def open_boost_backend(url=BOOST_COUNTS_URL):
+    if url.startswith("sqlite:///"):
+        return SQLiteBoostCountsBackend(url[len("sqlite:///"):])
+    if url.startswith("memory://"):
+        return MemoryBoostCountsBackend()
+    raise ValueError(f"Unsupported boost counts backend URL: {url!r}")
+
+
+# Write-behind counter shared by every session in the process. A click is one
+# Counter increment; pending clicks are flushed as a single batched upsert per
+# FLUSH_INTERVAL, however many sessions clicked how often. Backend reads and writes
+# run outside the lock, so a slow write never blocks clicks or the leaderboard.
+class BoostCounter:
+    def __init__(self, backend, flush_interval=FLUSH_INTERVAL, read_ttl=READ_TTL):
+        self.backend = backend
+        self.flush_interval = flush_interval
+        self.read_ttl = read_ttl
+        self._pending = Counter()
+        # Clicks being written right now; still counted by top() until the write lands
+        self._in_flight = Counter()
+        self._lock = threading.Lock()
+        self._timer = None
+        # Last backend read: (day, {language: clicks}, monotonic time)
+        self._cached = None
+        # Bumped when a write starts and when it ends; a read that overlaps a
+        # write may or may not include it, so it is not cached
+        self._generation = 0
+        atexit.register(self.flush)
+
+    # Call with self._lock held
+    def _schedule_flush(self):
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def record(self, language, day=None):
+        with self._lock:
+            self._pending[(day or date.today(), language)] += 1
+            self._schedule_flush()
+
+    def flush(self):
+        with self._lock:
+            counts, self._pending = self._pending, Counter()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not counts:
+                return
+            self._in_flight.update(counts)
+            self._generation += 1
+        # Upserts add up in any order, so concurrent flushes need no ordering
+        try:
+            self.backend.add_many(counts)
+        except Exception:
+            # Put the clicks back and retry on the next flush
+            logger.exception("Boost count write of %d entries failed; will retry", len(counts))
+            with self._lock:
+                self._in_flight -= counts
+                self._generation += 1
+                self._pending.update(counts)
+                self._schedule_flush()
+            return
+        with self._lock:
+            self._in_flight -= counts
+            self._generation += 1
+            # Keep the cached read in step, so flushed clicks don't vanish until the next refresh
+            if self._cached is not None:
+                cached_day, cached_counts = self._cached[0], dict(self._cached[1])
+                for (day, language), n in counts.items():
+                    if day == cached_day:
+                        cached_counts[language] = cached_counts.get(language, 0) + n
+                self._cached = (cached_day, cached_counts, self._cached[2])
+
+    # Top `limit` (language, clicks) pairs for the day across all sessions and
+    # replicas: the cached backend counts plus this process's unflushed clicks
+    def top(self, limit=5, day=None):
+        day = day or date.today()
+        with self._lock:
+            cached, generation = self._cached, self._generation
+        if cached is None or cached[0] != day or time.monotonic() - cached[2] > self.read_ttl:
+            cached = (day, self.backend.counts_for(day), time.monotonic())
+            with self._lock:
+                if self._generation == generation and not self._in_flight:
+                    self._cached = cached
+        with self._lock:
+            totals = Counter(cached[1])
+            for unflushed in (self._pending, self._in_flight):
+                for (d, language), n in unflushed.items():
+                    if d == day:
+                        totals[language] += n
+        return totals.most_common(limit)
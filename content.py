@@ -0,0 +1,166 @@
+import logging
+import os
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+from PIL import ImageColor
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    import toml as tomllib  # ships with Streamlit; also provides loads(str)
+
+# --- PORTFOLIO CONTENT (content.toml) ---
+CONTENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content.toml")
+SCHEMA_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+# Parsed, validated and frozen content. Mappings are read-only views and lists are
+# tuples, so one instance can be shared by every session without copying.
+Content = namedtuple("Content", ["schema_version", "languages", "skill_categories", "projects", "timeline", "resume"])
+
+
+class ContentError(ValueError):
+    pass
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _require(condition, message):
+    if not condition:
+        raise ContentError(message)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_text(value):
+    return isinstance(value, str) and value.strip() != ""
+
+
+# A CSS/PIL color ("#1F6FEB", "navy") or one of the app's named theme colors
+def _is_color(value, color_names):
+    if not _is_text(value):
+        return False
+    if value in color_names:
+        return True
+    try:
+        ImageColor.getrgb(value)
+    except ValueError:
+        return False
+    return True
+
+
+# `color_names`: theme color names the app accepts for mockup colors
+def parse_content(text, color_names=()):
+    try:
+        data = tomllib.loads(text)
+    except Exception as exc:  # tomllib.TOMLDecodeError / toml.TomlDecodeError
+        raise ContentError(f"content file is not valid TOML: {exc}") from exc
+
+    _require(data.get("schema_version") == SCHEMA_VERSION,
+             f"unsupported schema_version {data.get('schema_version')!r} (expected {SCHEMA_VERSION})")
+
+    languages = data.get("languages")
+    _require(isinstance(languages, dict) and languages, "[languages] must map skill names to scores")
+    for name, score in languages.items():
+        _require(isinstance(score, int) and not isinstance(score, bool) and 0 <= score <= 100,
+                 f"languages.{name} must be an integer from 0 to 100")
+
+    categories = data.get("skill_categories", {})
+    _require(isinstance(categories, dict) and all(_is_text(c) for c in categories.values()),
+             "[skill_categories] must map skill names to category names")
+
+    projects = data.get("projects")
+    _require(isinstance(projects, dict) and projects, "[projects] must contain at least one project")
+    for name, project in projects.items():
+        _require(isinstance(project, dict), f"projects.{name} must be a table")
+        for key in ("description", "status", "mockup"):
+            _require(key in project, f"projects.{name} is missing {key!r}")
+        _require(isinstance(project["description"], str), f"projects.{name}.description must be a string")
+        _require(isinstance(project.get("summary", ""), str), f"projects.{name}.summary must be a string")
+        status, mockup = project["status"], project["mockup"]
+        _require(isinstance(status, dict) and isinstance(mockup, dict),
+                 f"projects.{name}.status and .mockup must be tables")
+        for key, value in status.items():
+            _require(isinstance(value, str) or _is_number(value),
+                     f"projects.{name}.status.{key} must be a string or a number")
+        progress = status.get("Progress")
+        _require(_is_number(progress) and 0 <= progress <= 1,
+                 f"projects.{name}.status.Progress must be a number between 0 and 1")
+        _require(_is_text(mockup.get("text")), f"projects.{name}.mockup.text must be a non-empty string")
+        for key in ("background", "foreground"):
+            _require(_is_color(mockup.get(key), color_names),
+                     f"projects.{name}.mockup.{key} must be a theme color name or a color like '#1F6FEB'")
+
+    timeline = data.get("timeline", [])
+    _require(isinstance(timeline, list), "[[timeline]] entries must be an array of tables")
+    for i, entry in enumerate(timeline):
+        _require(isinstance(entry, dict) and "year" in entry and "event" in entry,
+                 f"timeline entry {i + 1} needs 'year' and 'event'")
+        _require(isinstance(entry["year"], (str, int)) and not isinstance(entry["year"], bool),
+                 f"timeline entry {i + 1}: 'year' must be a string or an integer")
+        _require(isinstance(entry["event"], str), f"timeline entry {i + 1}: 'event' must be a string")
+        bold = entry.get("bold", [])
+        _require(isinstance(bold, list) and all(_is_text(phrase) for phrase in bold),
+                 f"timeline entry {i + 1}: 'bold' must be a list of phrases")
+
+    resume = data.get("resume", {})
+    _require(isinstance(resume, dict) and all(isinstance(v, str) for v in resume.values()),
+             "[resume] must be a table of strings")
+
+    return Content(
+        schema_version=data["schema_version"],
+        languages=_freeze(languages),
+        skill_categories=_freeze(categories),
+        projects=_freeze(projects),
+        # (year, event, phrases to bold), the shape the timeline renderer caches on
+        timeline=tuple((str(e["year"]), e["event"], tuple(e.get("bold", ()))) for e in timeline),
+        resume=_freeze(resume),
+    )
+
+
+def load_content(path=CONTENT_PATH, color_names=()):
+    with open(path, encoding="utf-8") as f:
+        return parse_content(f.read(), color_names)
+
+
+# Process-wide holder: parses once, then only re-parses when the file's mtime
+# changes. A broken edit keeps serving the last good content instead of
+# taking the page down.
+class ContentLoader:
+    def __init__(self, path=CONTENT_PATH, color_names=()):
+        self.path = path
+        self.color_names = frozenset(color_names)
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._content = None
+
+    def get(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            # e.g. mid atomic-rename save; try again on the next rerun
+            if self._content is None:
+                raise
+            return self._content
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:
+                    try:
+                        self._content = load_content(self.path, self.color_names)
+                    except (ContentError, OSError, ValueError):
+                        if self._content is None:
+                            raise
+                        logger.exception("Keeping previous content; %s failed to reload", self.path)
+                    self._mtime = mtime
+        return self._content
@@ -0,0 +1,30 @@
+import io
+
+from PIL import Image, ImageOps
+
+# --- IMAGE PIPELINE ---
+# Pillow >= 9.1 moved the filters under Image.Resampling
+LANCZOS = getattr(Image, "Resampling", Image).LANCZOS
+
+
+def encode_image(img, fmt="WEBP", quality=85):
+    buffer = io.BytesIO()
+    try:
+        img.save(buffer, format=fmt, quality=quality)
+    except (KeyError, OSError):
+        # Pillow built without WebP support
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+# Decode `path` and shrink it to `width` pixels wide (keeping the aspect ratio)
+def make_thumbnail(path, width, fmt="WEBP", quality=85):
+    with Image.open(path) as img:
+        # Let the JPEG decoder downscale by 1/2..1/8 while decoding instead of
+        # building the full-resolution bitmap first (both sides stay >= width,
+        # so an EXIF rotation afterwards cannot leave it too small)
+        img.draft("RGB", (width, width))
+        img = ImageOps.exif_transpose(img).convert("RGB")
+        height = max(1, round(img.height * width / img.width))
+        return encode_image(img.resize((width, height), LANCZOS), fmt, quality)
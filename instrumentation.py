@@ -0,0 +1,129 @@
+import functools
+import json
+import logging
+import os
+import time
+import tracemalloc
+
+import streamlit as st
+
+try:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+except ImportError:  # older Streamlit releases
+    from streamlit.scriptrunner import get_script_run_ctx
+
+# --- PER-SECTION PROFILING (opt-in) ---
+# PORTFOLIO_PROFILE=1 writes one JSON log line per rendered section.
+# Opening the app with ?debug=1 shows the latest numbers in a sidebar panel; it
+# only reveals them, the recording itself is switched on by the environment.
+PROFILE_ENV = "PORTFOLIO_PROFILE"
+DEBUG_QUERY_PARAM = "debug"
+STATE_KEY = "_section_profile"
+PROFILING = os.environ.get(PROFILE_ENV, "0") not in ("", "0")
+
+# Traced once for the life of the process. Sessions render sections on their own
+# threads at the same time, so a section must never stop or reset the tracer.
+if PROFILING and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+logger = logging.getLogger("portfolio.profile")
+if not logger.handlers:
+    # Bare JSON lines on stderr, independent of Streamlit's own log config
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def _debug_requested():
+    try:
+        value = st.query_params.get(DEBUG_QUERY_PARAM)
+    except AttributeError:  # Streamlit < 1.30
+        value = (st.experimental_get_query_params().get(DEBUG_QUERY_PARAM) or [None])[0]
+    return value not in (None, "", "0", "false")
+
+
+# Counts delta messages (one per emitted element/block) sent while a section runs
+# by wrapping the script run context's enqueue callback.
+class _DeltaCounter:
+    def __init__(self):
+        self.ctx = get_script_run_ctx()
+        self.count = 0
+        self._original = None
+
+    def __enter__(self):
+        if self.ctx is not None:
+            self._original = self.ctx._enqueue
+
+            def counting_enqueue(msg):
+                if msg.WhichOneof("type") == "delta":
+                    self.count += 1
+                self._original(msg)
+
+            self.ctx._enqueue = counting_enqueue
+        return self
+
+    def __exit__(self, *exc):
+        if self._original is not None:
+            self.ctx._enqueue = self._original
+
+
+# Decorator for a page section. When profiling is off it only adds one
+# function call; when on it records wall time, the change in traced memory and
+# the element count. Traced memory is process-wide, so with several sessions
+# rendering at once the allocation figure also includes their work.
+def profiled(name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILING:
+                return func(*args, **kwargs)
+
+            mem_before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            try:
+                with _DeltaCounter() as deltas:
+                    return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                mem_after = tracemalloc.get_traced_memory()[0]
+                record = {
+                    "section": name,
+                    "wall_ms": round(elapsed * 1000, 3),
+                    "alloc_kib": round((mem_after - mem_before) / 1024, 1),
+                    "elements": deltas.count,
+                    "at": time.time(),
+                }
+                logger.info(json.dumps(record))
+                st.session_state.setdefault(STATE_KEY, {})[name] = record
+        return wrapper
+    return decorator
+
+
+# Hidden panel with the latest numbers per section (only with ?debug=1).
+# `process_stats` is an optional callable returning process-wide numbers to list below.
+def render_debug_panel(process_stats=None):
+    if not _debug_requested():
+        return
+    records = list(st.session_state.get(STATE_KEY, {}).values())
+    with st.sidebar.expander("Rerun profile (debug)", expanded=True):
+        if records:
+            st.dataframe(
+                [{k: r[k] for k in ("section", "wall_ms", "alloc_kib", "elements")} for r in records],
+                use_container_width=True,
+                hide_index=True,
+            )
+            st.caption(f"Total: {sum(r['wall_ms'] for r in records):.1f} ms, "
+                       f"{sum(r['elements'] for r in records)} elements")
+        elif PROFILING:
+            st.caption("No sections recorded yet.")
+        else:
+            st.caption(f"Section profiling is off; start the app with {PROFILE_ENV}=1 to record it.")
+        if process_stats is not None:
+            st.markdown("**Process**")
+            st.dataframe(
+                [{"metric": name, "value": value} for name, value in process_stats().items()],
+                use_container_width=True,
+                hide_index=True,
+            )
@@ -0,0 +1,53 @@
+import importlib
+import os
+import threading
+
+# --- DEFERRED IMPORTS ---
+# pandas, numpy and pydeck dominate the cold start of a fresh worker. With lazy
+# imports on (the default) `pd = lazy_import("pandas")` binds a small proxy
+# that imports the real module the first time an attribute is used, i.e. when a
+# section that needs it renders. PORTFOLIO_LAZY_IMPORTS=0 imports everything
+# eagerly, the old behaviour.
+LAZY_IMPORTS = os.environ.get("PORTFOLIO_LAZY_IMPORTS", "1") != "0"
+
+_proxies = {}
+_proxies_lock = threading.Lock()
+
+
+# Stand-in for a module until first use. Sessions run on their own threads, so
+# the first load happens under a lock: every thread gets the fully imported
+# module (importlib.util.LazyLoader is not safe for this before Python 3.12).
+class _LazyModule:
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+                module = self._module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded yet"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name):
+    if not LAZY_IMPORTS:
+        return importlib.import_module(name)
+    with _proxies_lock:
+        proxy = _proxies.get(name)
+        if proxy is None:
+            proxy = _proxies[name] = _LazyModule(name)
+        return proxy
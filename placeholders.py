@@ -0,0 +1,29 @@
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+from images import encode_image
+
+# --- LOCAL MOCKUP BANNERS (replaces placehold.co) ---
+PLACEHOLDER_CACHE_SIZE = 64  # distinct (text, colors, size, format) combinations kept encoded
+FONT_SIZE_RATIO = 0.14  # font size relative to banner height
+
+
+def _font(size):
+    try:
+        return ImageFont.load_default(size=size)  # scalable built-in font, Pillow >= 10.1
+    except TypeError:
+        return ImageFont.load_default()
+
+
+# Solid `background` banner with `text` centered in `foreground`, as encoded bytes.
+# Results are kept in a bounded LRU so repeat requests cost a dict lookup.
+@lru_cache(maxsize=PLACEHOLDER_CACHE_SIZE)
+def render_placeholder(text, background, foreground, width=400, height=200, fmt="PNG"):
+    img = Image.new("RGB", (width, height), background)
+    draw = ImageDraw.Draw(img)
+    font = _font(max(10, int(height * FONT_SIZE_RATIO)))
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    position = ((width - (right - left)) / 2 - left, (height - (bottom - top)) / 2 - top)
+    draw.text(position, text, fill=foreground, font=font)
+    return encode_image(img, fmt)
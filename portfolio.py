@@ -1,7 +1,31 @@
+import functools
+import html
+import os
+
 import streamlit as st
-import pandas as pd
-import numpy as np
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
+
+from lazy import lazy_import
+from study_log import HOURS_COL, ROLLING_DAYS
+from study_log_store import StudyLogStore, open_backend
+from study_log_export import EXPORT_FORMATS, export_study_log
+from boost_counts import BoostCounter, open_boost_backend
+from skills import SkillScores, MAX_SCORE, SCORE_COL, TIME_COL
+from instrumentation import profiled, render_debug_panel
+from routes import Route, build_polyline
+from tracks import TrackStore, parse_track
+from images import make_thumbnail
+from placeholders import render_placeholder
+from static_assets import publish, static_serving_enabled, minify_css
+from timeline import render_timeline_html, page_count
+from skill_grid import group_skills, render_skill_grid_html, SORT_OPTIONS
+from content import ContentLoader, CONTENT_PATH
+from session_memory import SessionMemoryManager
+from resume import RESUME_FORMATS, export_resume
+
+# Heavy libraries load on first use (see lazy.py); PORTFOLIO_LAZY_IMPORTS=0 restores eager imports
+np = lazy_import("numpy")
+pdk = lazy_import("pydeck")
 
 # --- COLOR DEFINITIONS (Royal Blue & Gold Theme - Academic) ---
 # Primary Backgrounds
@@ -19,30 +43,40 @@ LIGHT_GRAY_TEXT = "#C9D1D9" # General text, labels (Light Gray)
 MEDIUM_GRAY_NEUTRAL = "#6A6A6A" # Footer, less prominent borders/dividers
 
 
-# --- DATA SETUP ---
-initial_languages = {
-    "Python": 90, "C++": 85, "Java": 75, "SQL": 80, 
-    "C": 70, "JavaScript": 65, "C#": 50, "Kotlin": 40, "Assembly": 30
-}
-projects = {
-    "Tamagotchi Teaches Programming": {
-        "description": "An interactive, gamified learning tool where users nurture a digital pet by successfully completing programming challenges.",
-        "status": {"Focus": "Full-Stack, Gamification", "Progress": 0.1, "Next Step": "Wireframing UI"},
-        # Image URL uses Blue
-        "image_url": f"https://placehold.co/400x200/{ROYAL_BLUE.strip('#')}/{DARK_GRAY.strip('#')}?text=WEB+DEV+PROJECT"
-    },
-    "Budgetables": {
-        "description": "A localized guide to track the real-time or seasonal range of prices for fruits and vegetables in local markets to aid budgeting.",
-        # --- FIXED: Changed Focus from Data Science to App Dev ---
-        "status": {"Focus": "App Development, Data Collection, UX", "Progress": 0.05, "Next Step": "Market Research & Data Sourcing"},
-        # Image URL uses Gold
-        "image_url": f"https://placehold.co/400x200/{VIBRANT_GOLD.strip('#')}/{DARK_GRAY.strip('#')}?text=APP+DEV+PROJECT"
-    }
+# Color names usable for project mockups in content.toml
+THEME_COLORS = {
+    "DEEP_CHARCOAL": DEEP_CHARCOAL, "DARK_GRAY": DARK_GRAY, "SUBTLE_DARKER_GRAY": SUBTLE_DARKER_GRAY,
+    "ROYAL_BLUE": ROYAL_BLUE, "VIBRANT_GOLD": VIBRANT_GOLD, "BUTTON_HOVER_BG": BUTTON_HOVER_BG,
+    "LIGHT_GRAY_TEXT": LIGHT_GRAY_TEXT, "MEDIUM_GRAY_NEUTRAL": MEDIUM_GRAY_NEUTRAL,
 }
 
-# Initialize session state for language scores
+# --- DATA SETUP ---
+# Skills, projects, timeline and resume fields live in content.toml. The loader is shared
+# by the whole process: it parses once and only re-parses after the file is edited.
+@st.cache_resource
+def get_content_loader():
+    return ContentLoader(CONTENT_PATH, color_names=THEME_COLORS)
+
+content = get_content_loader().get()
+projects = content.projects
+skill_categories = content.skill_categories
+timeline_data = content.timeline
+
+# Process-wide session memory accounting: state of sessions idle for a while is
+# spilled to disk and comes back on their next interaction (see session_memory.py)
+@st.cache_resource
+def get_session_memory():
+    return SessionMemoryManager()
+
+session_memory = get_session_memory()
+session_memory.touch()
+
+# Initialize session state for language scores. Sessions share the content's read-only
+# scores and only store their own boosts; after a content edit they move to the new baseline.
 if 'languages' not in st.session_state:
-    st.session_state.languages = initial_languages
+    st.session_state.languages = SkillScores(content.languages)
+elif st.session_state.languages.baseline is not content.languages:
+    st.session_state.languages.rebase(content.languages)
 
 
 # Function to generate the fixed Dark CSS 
@@ -157,6 +191,27 @@ def get_custom_css():
     </style>
     """
 
+# The stylesheet only depends on the color constants, so it is generated and
+# minified once per process instead of re-formatted on every rerun
+@st.cache_resource
+def get_theme_css():
+    return minify_css(get_custom_css())
+
+
+# With static serving on, the stylesheet is written once as a content-hashed file
+# under static/generated/ (served as text/css) and each rerun only sends a one-line
+# @import of it; PORTFOLIO_THEME_CSS=inline sends the whole stylesheet every rerun
+# instead. Streamlit sends no Cache-Control for static files, so browsers revalidate
+# it by ETag unless a proxy adds long-lived headers (see the README).
+THEME_CSS_MODE = os.environ.get("PORTFOLIO_THEME_CSS", "link")
+
+
+@st.cache_resource
+def get_theme_css_url():
+    css = get_theme_css().removeprefix("<style>").removesuffix("</style>")
+    return publish("theme", css.encode("utf-8"), "css")
+
+
 # Set the page configuration early for a custom look
 st.set_page_config(
     page_title="Kesha Jane Ceniza - CS Student Portfolio",
@@ -165,428 +220,631 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Apply the theme CSS
-st.markdown(get_custom_css(), unsafe_allow_html=True)
-
-
-# Creating DataFrame for Skills Chart (reads from session state)
-df_skills_chart = pd.DataFrame(
-    list(st.session_state.languages.items()), columns=['Language', 'Experience Score (out of 100)']
-).set_index('Language')
+# Apply the theme CSS (built and minified once per process, see get_theme_css)
+if THEME_CSS_MODE == "link" and static_serving_enabled() and hasattr(st, "html"):
+    # st.html's sanitizer drops <link> but keeps <style>; a style-only block goes to
+    # the event container, so it takes no space on the page
+    st.html(f"<style>@import url('{get_theme_css_url()}');</style>")
+else:
+    st.markdown(get_theme_css(), unsafe_allow_html=True)
 
 
-# Coordinates and data for the simulated walking path map
-coords = {
-    'lat': [10.3013, 10.3050, 10.3080], 'lon': [123.8906, 123.8890, 123.8870],
-}
-coords['lat'].extend(np.linspace(10.3080, 10.3120, 5))
-coords['lon'].extend(np.linspace(123.8870, 123.8860, 5))
-coords['lat'].extend(np.linspace(10.3120, 10.2933, 8))
-coords['lon'].extend(np.linspace(123.8860, 123.9016, 8))
-coords['lat'].extend(np.linspace(10.2933, 10.3013, 5))
-coords['lon'].extend(np.linspace(123.9016, 123.8906, 5))
-map_data = pd.DataFrame(coords)
+# Anchor points of the simulated walking path (CIT-U -> Labangon -> National Museum -> CIT-U)
+# and how many evenly spaced points to draw on each leg between them
+WALK_ANCHORS = [
+    (10.3013, 123.8906), (10.3050, 123.8890), (10.3080, 123.8870),
+    (10.3120, 123.8860), (10.2933, 123.9016), (10.3013, 123.8906),
+]
+WALK_STEPS = [1, 1, 4, 7, 4]
+MAP_ZOOM = 13
 
 
 # --- FUNCTION DEFINITIONS ---
 
-# Function to update the score in session state (+5 points)
+# Function to update the score in session state (+5 points); True if the score changed
 def update_score_add(language):
     # Ensure score doesn't exceed 100
-    if st.session_state.languages[language] < 100:
-        st.session_state.languages[language] = min(st.session_state.languages[language] + 5, 100)
-        st.toast(f"+5 Points Added! {language} score is now {st.session_state.languages[language]}%.", icon="🚀")
+    if st.session_state.languages[language] < MAX_SCORE:
+        new_score = st.session_state.languages.boost(language, 5)
+        # Counted for "Most Boosted Today"; written to the shared store in batches
+        get_boost_counter().record(language)
+        # Shown by the page rerun that follows (a toast sent right before st.rerun can be lost)
+        st.session_state.boost_toast = f"+5 Points Added! {language} score is now {new_score}%."
+        return True
+    st.toast(f"Mastery reached! {language} is already at 100%. Great job!", icon="🎉")
+    return False
+
+
+# Interactive sections run as fragments, so a widget change only reruns (and re-sends)
+# its own section instead of the whole page. PORTFOLIO_FRAGMENTS=0 turns them back into
+# plain functions, e.g. to compare full-page rerun cost.
+USE_FRAGMENTS = os.environ.get("PORTFOLIO_FRAGMENTS", "1") != "0"
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+
+def section_fragment(func):
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        # A fragment rerun skips the top of the script, so spilled state is restored here too
+        session_memory.touch()
+        return func(*args, **kwargs)
+    return _fragment(run) if USE_FRAGMENTS and _fragment is not None else run
+
+
+# "#RRGGBB" -> [r, g, b] for pydeck layer colors
+def hex_to_rgb(color):
+    color = color.lstrip('#')
+    return [int(color[i:i + 2], 16) for i in (0, 2, 4)]
+
+
+# Walking route built once per process, with simplified versions precomputed per zoom level
+@st.cache_resource
+def get_walk_route():
+    return Route(build_polyline(WALK_ANCHORS, WALK_STEPS))
+
+
+# Profile photo thumbnail, rebuilt only when the file's mtime changes. Every session
+# gets the same bytes, so Streamlit serves them from one media file entry.
+@st.cache_resource
+def get_profile_thumbnail(path, width, mtime):
+    return make_thumbnail(path, width)
+
+
+# Static URL of a project's mockup banner, written to static/generated/ once per process
+@st.cache_resource
+def get_mockup_url(text, background, foreground):
+    return publish("mockup", render_placeholder(text, background, foreground), "png")
+
+
+# Project mockup banner rendered in-process instead of fetched from placehold.co.
+# With static serving on, browsers load it from a long-cached URL; otherwise the
+# (LRU-cached) bytes go through st.image.
+def show_mockup(project_key, mockup):
+    caption = f"Mockup for {project_key}"
+    background = THEME_COLORS.get(mockup["background"], mockup["background"])
+    foreground = THEME_COLORS.get(mockup["foreground"], mockup["foreground"])
+    if static_serving_enabled():
+        url = get_mockup_url(mockup["text"], background, foreground)
+        # Project names come from content.toml; quotes would end the alt attribute early
+        safe_caption = html.escape(caption, quote=True)
+        st.markdown(
+            f"<img src='{url}' alt='{safe_caption}' style='width: 100%;'>"
+            f"<p style='text-align: center; font-size: 0.875rem; color: {MEDIUM_GRAY_NEUTRAL};'>{safe_caption}</p>",
+            unsafe_allow_html=True
+        )
     else:
-        st.toast(f"Mastery reached! {language} is already at 100%. Great job!", icon="🎉")
+        st.image(render_placeholder(mockup["text"], background, foreground), caption=caption)
+
+
+# Parse newly uploaded GPX/CSV walks into the session's TrackStore (each file only once)
+def import_walk_uploads(uploads):
+    tracks = st.session_state.setdefault('walk_tracks', TrackStore())
+    seen = st.session_state.setdefault('walk_files', set())
+    walks = []
+    for upload in uploads:
+        file_key = (upload.name, upload.size)
+        if file_key in seen:
+            continue
+        seen.add(file_key)
+        try:
+            walks.append((upload.name, parse_track(upload.name, upload)))
+        except ValueError as exc:
+            st.warning(f"Could not read {upload.name}: {exc}")
+    tracks.add_many(walks)
+    return tracks
+
+
+# Durable study log shared by every session in this process (pooled SQLite by default,
+# see STUDY_LOG_URL). Submits are batched before they hit the database.
+@st.cache_resource
+def get_study_log_store():
+    store = StudyLogStore(open_backend())
+    if store.count() == 0:
+        store.append(datetime.today().date(), 'Python', 1.5)
+    return store
+
+
+# Boost clicks from every session, coalesced per language and flushed to the shared
+# store (BOOST_COUNTS_URL) in one write per interval
+@st.cache_resource
+def get_boost_counter():
+    return BoostCounter(open_boost_backend())
 
 
 # --- SIDEBAR (st.sidebar) ---
-st.sidebar.title("About the Author 👤")
-
-st.sidebar.markdown("<br>", unsafe_allow_html=True)
-
-# -----------------------------------------------------------
-# >>> PROFILE PICTURE SECTION (Sidebar) <<<
-# This uses the local path 'img/CENIZA.jpg' to ensure the image loads when running locally.
-# NOTE: Place your image file in the 'img' directory next to portfolio.py
-PROFILE_PATH = "img/CENIZA.jpg"
-SIDEBAR_IMG_SIZE = 150 
-
-st.sidebar.image(PROFILE_PATH, width=SIDEBAR_IMG_SIZE)
-# -----------------------------------------------------------
-
-st.sidebar.caption("Connect with me!")
-
-st.sidebar.markdown("<br>", unsafe_allow_html=True)
-
-st.sidebar.metric(label="University", value="CIT-U")
-st.sidebar.metric(label="Student Status", value="2nd Year CS")
-st.sidebar.metric(label="Duolingo Streak (Days)", value="450", delta="Consistent Learning!")
-
-st.sidebar.markdown("<br>", unsafe_allow_html=True)
-
-# New: Download Resume Button (Improved format)
-resume_text = f"""
-========================================
-          PORTFOLIO RESUME
-========================================
-
-Name: [Your Name]
-Title: CS Student & Project Analytics Officer
-University: Cebu Institute of Technology - University
-Year: 2nd Year Computer Science
-
-========================================
-          TECHNICAL SKILLS
-========================================
-{', '.join(initial_languages.keys())}
-
-========================================
-          PROJECT IDEAS
-========================================
-1. Tamagotchi Teaches Programming
-    - Gamified learning tool for programming
-    
-2. Budgetables
-    - Price tracking app for local market produce
-
-========================================
-          CONTACT
-========================================
-Email: keshajane24@gmail.com
-GitHub: martianK3jC
-LinkedIn: Kesha Jane L. Ceniza
-
-========================================
-"""
-
-st.sidebar.download_button(
-    label="📄 Download Resume (TXT)",
-    data=resume_text,
-    file_name='portfolio_resume.txt',
-    mime='text/plain',
-    help="Download a text version of the portfolio resume"
-)
+# Resume files are built only when the download is clicked (a deferred download),
+# then cached per format for the loaded content (see resume.py), so ordinary reruns
+# never render or ship them.
+@section_fragment
+def resume_download():
+    fmt = st.selectbox("Resume format", list(RESUME_FORMATS), key='resume_format')
+    _, file_name, mime = RESUME_FORMATS[fmt]
+    st.download_button(
+        label=f"⬇️ Download Resume ({fmt})",
+        data=lambda: export_resume(content, fmt)[0],
+        file_name=file_name,
+        mime=mime,
+        key='resume_download',
+        use_container_width=True,
+        help="Download the portfolio resume in the selected format"
+    )
 
-st.sidebar.markdown("<br>", unsafe_allow_html=True)
 
-st.sidebar.header("Achievements")
-# --- UPDATED TEXT HERE ---
-st.sidebar.success("✅ Advanced Past Round 1: Ceb-i Hacks Cutoff")
-# -------------------------
-st.sidebar.info("📌 Project Analytics Officer: GDG CIT-U")
+@profiled("Sidebar")
+def sidebar_section():
+    st.sidebar.title("About the Author 👤")
 
-st.sidebar.markdown("<br>", unsafe_allow_html=True)
+    st.sidebar.markdown("<br>", unsafe_allow_html=True)
 
-st.sidebar.header("Aspirations & Fun Facts")
-st.sidebar.info(
-    "**Aspiration:** Proficient Full-Stack Web Developer & Data Science dabbler. "
-    "\n\n**Fun Facts:** Loves walking/hiking, watching funny reels, and competitive eating (I need to start!). Painting is a passion, even if I'm not great at it."
-)
+    # -----------------------------------------------------------
+    # >>> PROFILE PICTURE SECTION (Sidebar) <<<
+    # This uses the local path 'img/CENIZA.jpg' to ensure the image loads when running locally.
+    # NOTE: Place your image file in the 'img' directory next to portfolio.py
+    PROFILE_PATH = "img/CENIZA.jpg"
+    SIDEBAR_IMG_SIZE = 150 
 
-st.sidebar.markdown("<br>", unsafe_allow_html=True)
+    # Pre-shrunk WebP thumbnail (decoded once per process and photo version) at twice
+    # the display width, so it stays sharp on high-DPI screens at a fraction of the JPEG's size
+    thumbnail = get_profile_thumbnail(PROFILE_PATH, SIDEBAR_IMG_SIZE * 2, os.path.getmtime(PROFILE_PATH))
+    st.sidebar.image(thumbnail, width=SIDEBAR_IMG_SIZE)
+    # -----------------------------------------------------------
 
-st.sidebar.progress(85, text="Motivation Level")
+    st.sidebar.caption("Connect with me!")
 
+    st.sidebar.markdown("<br>", unsafe_allow_html=True)
 
-# --- MAIN CONTENT: SINGLE SCROLLABLE PAGE ---
+    st.sidebar.metric(label="University", value="CIT-U")
+    st.sidebar.metric(label="Student Status", value="2nd Year CS")
+    st.sidebar.metric(label="Duolingo Streak (Days)", value="450", delta="Consistent Learning!")
 
-st.markdown("<br>", unsafe_allow_html=True)
+    st.sidebar.markdown("<br>", unsafe_allow_html=True)
 
-# 1. HOME / BIO SECTION
-col1, col2 = st.columns([3, 1])
+    # New: Download Resume Button (Improved format)
+    with st.sidebar:
+        resume_download()
 
-with col1:
-    st.title("The CS Journey Portfolio")
-    st.header("Confusion: It's a Feature, Not a Bug")
-    # Text color is fixed to dark theme's light gray
-    bio_color = LIGHT_GRAY_TEXT 
-    st.markdown(
-        f"""
-        <p style='font-size: 1.2rem; color: {bio_color}; line-height: 1.8; margin-bottom: 1rem;'>
-        Confusion isn't a bug, it's a <strong>feature</strong> of programming. If you're not confused, you're not learning—or you're just very good at pretending you're not confused during a late-night debugging session.
-        </p>
-        <p style='font-size: 1.2rem; color: {bio_color}; line-height: 1.8;'>
-        As a <strong>Second-Year Computer Science Student at Cebu Institute of Technology - University (CIT-U)</strong>, I specialize in bridging technical problem-solving with organizational oversight, currently serving as a <strong>Project Analytics Officer</strong> for the Google Developer Group on campus.
-        </p>
-        """, 
-        unsafe_allow_html=True
+    st.sidebar.markdown("<br>", unsafe_allow_html=True)
+
+    st.sidebar.header("Achievements")
+    # --- UPDATED TEXT HERE ---
+    st.sidebar.success("✅ Advanced Past Round 1: Ceb-i Hacks Cutoff")
+    # -------------------------
+    st.sidebar.info("📌 Project Analytics Officer: GDG CIT-U")
+
+    st.sidebar.markdown("<br>", unsafe_allow_html=True)
+
+    st.sidebar.header("Aspirations & Fun Facts")
+    st.sidebar.info(
+        "**Aspiration:** Proficient Full-Stack Web Developer & Data Science dabbler. "
+        "\n\n**Fun Facts:** Loves walking/hiking, watching funny reels, and competitive eating (I need to start!). Painting is a passion, even if I'm not great at it."
     )
-with col2:
-    st.markdown("<br><br>", unsafe_allow_html=True) 
-    st.metric(label="Experience Focus", value="Analytics + Code", delta="Growing Daily!")
 
-st.markdown("<br>", unsafe_allow_html=True)
-st.markdown("---")
-st.markdown("<br>", unsafe_allow_html=True)
+    st.sidebar.markdown("<br>", unsafe_allow_html=True)
 
-# 2. SKILLS SECTION
-st.header("Technical Skillset 🛠️")
-st.caption("A visualization of experience (based on a highly scientific self-assessment 😉)")
+    st.sidebar.progress(85, text="Motivation Level")
 
-st.markdown("<br>", unsafe_allow_html=True)
+sidebar_section()
 
-# Interactive Bar Chart (Reads from session state)
-st.subheader("Language Proficiency Comparison")
-# Dynamic chart color uses VIBRANT_GOLD
-chart_color = VIBRANT_GOLD 
-st.bar_chart(df_skills_chart, use_container_width=True, color=chart_color)
+# --- MAIN CONTENT: SINGLE SCROLLABLE PAGE ---
 
 st.markdown("<br>", unsafe_allow_html=True)
 
-# Split skills into 3 columns for better layout on desktop
-skill_cols = st.columns(3)
+# 1. HOME / BIO SECTION
+@profiled("Home/Bio")
+def home_section():
+    col1, col2 = st.columns([3, 1])
+
+    with col1:
+        st.title("The CS Journey Portfolio")
+        st.header("Confusion: It's a Feature, Not a Bug")
+        # Text color is fixed to dark theme's light gray
+        bio_color = LIGHT_GRAY_TEXT 
+        st.markdown(
+            f"""
+            <p style='font-size: 1.2rem; color: {bio_color}; line-height: 1.8; margin-bottom: 1rem;'>
+            Confusion isn't a bug, it's a <strong>feature</strong> of programming. If you're not confused, you're not learning—or you're just very good at pretending you're not confused during a late-night debugging session.
+            </p>
+            <p style='font-size: 1.2rem; color: {bio_color}; line-height: 1.8;'>
+            As a <strong>Second-Year Computer Science Student at Cebu Institute of Technology - University (CIT-U)</strong>, I specialize in bridging technical problem-solving with organizational oversight, currently serving as a <strong>Project Analytics Officer</strong> for the Google Developer Group on campus.
+            </p>
+            """, 
+            unsafe_allow_html=True
+        )
+    with col2:
+        st.markdown("<br><br>", unsafe_allow_html=True) 
+        st.metric(label="Experience Focus", value="Analytics + Code", delta="Growing Daily!")
 
-# Core Languages (Re-using progress bars for detailed view)
-with skill_cols[0]:
-    st.subheader("Core Languages")
     st.markdown("<br>", unsafe_allow_html=True)
-    st.progress(st.session_state.languages['Python'] / 100, text=f"Python ({st.session_state.languages['Python']}%)")
-    st.progress(st.session_state.languages['SQL'] / 100, text=f"SQL ({st.session_state.languages['SQL']}%)")
-    st.progress(st.session_state.languages['C++'] / 100, text=f"C++ ({st.session_state.languages['C++']}%)")
-    st.progress(st.session_state.languages['Java'] / 100, text=f"Java ({st.session_state.languages['Java']}%)")
-
-# Web/Foundational
-with skill_cols[1]:
-    st.subheader("Web & Foundations")
+    st.markdown("---")
     st.markdown("<br>", unsafe_allow_html=True)
-    st.progress(st.session_state.languages['JavaScript'] / 100, text=f"JavaScript ({st.session_state.languages['JavaScript']}%)")
-    st.progress(st.session_state.languages['C'] / 100, text=f"C ({st.session_state.languages['C']}%)")
-    st.progress(st.session_state.languages['C#'] / 100, text=f"C# ({st.session_state.languages['C#']}%)")
 
-# Specialized/Mobile
-with skill_cols[2]:
-    st.subheader("Specialty")
+home_section()
+
+# 2. SKILLS SECTION
+@section_fragment
+@profiled("Skills")
+def skills_section():
+    st.header("Technical Skillset 🛠️")
+    st.caption("A visualization of experience (based on a highly scientific self-assessment 😉)")
+
     st.markdown("<br>", unsafe_allow_html=True)
-    st.progress(st.session_state.languages['Kotlin'] / 100, text=f"Kotlin ({st.session_state.languages['Kotlin']}%)")
-    st.progress(st.session_state.languages['Assembly'] / 100, text=f"Assembly ({st.session_state.languages['Assembly']}%)")
 
-st.markdown("<br>", unsafe_allow_html=True)
-    
-# Use an expander to show the full list clearly
-with st.expander("View Raw Skill Data"):
-    st.dataframe(df_skills_chart, use_container_width=True)
+    # DataFrame for Skills Chart (memoized on the session's scores, rebuilt only after a boost)
+    df_skills_chart = st.session_state.languages.frame()
+    skill_scores = df_skills_chart[SCORE_COL]
 
-st.markdown("<br>", unsafe_allow_html=True)
-st.markdown("---")
-st.markdown("<br>", unsafe_allow_html=True)
+    # Interactive Bar Chart (Reads from session state)
+    st.subheader("Language Proficiency Comparison")
+    # Dynamic chart color uses VIBRANT_GOLD
+    chart_color = VIBRANT_GOLD 
+    st.bar_chart(df_skills_chart, use_container_width=True, color=chart_color)
 
-# 3. ACADEMIC JOURNEY & TIMELINE
-st.header("Academic Journey & Milestones 📈")
-st.caption("A look at the path taken (and re-taken) to Computer Science.")
+    st.markdown("<br>", unsafe_allow_html=True)
 
-st.markdown("<br>", unsafe_allow_html=True)
+    # Filterable progress grid for every skill, rendered as a single element
+    col_search, col_category, col_sort = st.columns([2, 2, 1])
+    with col_search:
+        skill_query = st.text_input('Search skills:', key='skill_search')
+    with col_category:
+        # Categories as the grid groups them, so unmapped skills can be picked as "Other"
+        category_options = [category for category, _ in group_skills(skill_scores.items(), skill_categories)]
+        skill_filter = st.multiselect('Categories:', options=category_options, key='skill_category_filter')
+    with col_sort:
+        skill_sort = st.selectbox('Sort by:', options=SORT_OPTIONS, key='skill_sort')
 
-# Data structure for the timeline events
-timeline_data = [
-    ("2005", "Born in Cebu, Philippines!"),
-    ("2017", "Elementary School Graduation 🎓"),
-    ("2021", "High School Graduation"),
-    ("2023", "Senior High School Graduation"),
-    # Refined wording applied here (FIXED: removed redundant **)
-    ("2023-2024", "The Pivot: Initially failing Computer Engineering. This period was crucial, teaching me the true meaning of persistence and refining my career passion."),
-    ("2024", "Persistence Pays: I took a risk, faced the Dean, and successfully advocated for my transfer into the Computer Science program. That decision made all the difference."),
-    ("2024-Present", "Current Trajectory: I'm navigating the CS curriculum now, embracing the daily grind and pushing forward to build a rock-solid technical foundation.")
-]
+    st.markdown(
+        render_skill_grid_html(
+            tuple((name, int(score)) for name, score in skill_scores.items()),
+            tuple(skill_categories.items()),
+            skill_query,
+            tuple(skill_filter),
+            skill_sort,
+            VIBRANT_GOLD, SUBTLE_DARKER_GRAY, LIGHT_GRAY_TEXT, VIBRANT_GOLD,
+        ),
+        unsafe_allow_html=True
+    )
 
-# Displaying the timeline using columns
-year_color = ROYAL_BLUE 
-event_color = VIBRANT_GOLD 
-
-for year, event in timeline_data:
-    tl_col1, tl_col2 = st.columns([1, 4])
-    with tl_col1:
-        st.markdown(f"### <span style='color: {year_color};'>{year}</span>", unsafe_allow_html=True)
-    with tl_col2:
-        # We use an f-string with <strong> tags to apply bolding inside the markdown output
-        # Here we bold the key terms manually:
-        if year == "2024":
-            styled_event = event.replace("Computer Science", "<strong>Computer Science</strong>")
-        elif year == "2024-Present":
-            styled_event = event.replace("Current Trajectory", "<strong>Current Trajectory</strong>")
-        else:
-            styled_event = event
-            
-        st.markdown(f"<p style='color: {event_color}; font-size: 1.1rem; padding-top: 10px; line-height: 1.6;'>{styled_event}</p>", unsafe_allow_html=True)
+    st.markdown("<br>", unsafe_allow_html=True)
 
+    # Use an expander to show the full list clearly
+    with st.expander("View Raw Skill Data"):
+        st.dataframe(df_skills_chart, use_container_width=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("---")
     st.markdown("<br>", unsafe_allow_html=True)
 
-st.markdown("<br>", unsafe_allow_html=True)
-st.markdown("---") 
-st.markdown("<br>", unsafe_allow_html=True)
+skills_section()
+
+# 3. ACADEMIC JOURNEY & TIMELINE
+@section_fragment
+@profiled("Timeline")
+def timeline_section():
+    st.header("Academic Journey & Milestones 📈")
+    st.caption("A look at the path taken (and re-taken) to Computer Science.")
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Whole page of events as one HTML element (instead of columns + markdown per event)
+    pages = page_count(len(timeline_data))
+    page = 1
+    if pages > 1:
+        page = st.number_input("Timeline page", min_value=1, max_value=pages, value=1, step=1, key='timeline_page')
+    st.markdown(
+        render_timeline_html(timeline_data, ROYAL_BLUE, VIBRANT_GOLD, page - 1),
+        unsafe_allow_html=True
+    )
+
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("---") 
+    st.markdown("<br>", unsafe_allow_html=True)
+
+timeline_section()
 
 # 4. PORTFOLIO IDEAS SECTION (INTERACTIVE)
-st.header("Portfolio Ideas (Conceptual) 💡")
-st.caption("Use the selector to view project details and current mock status.")
+@section_fragment
+@profiled("Portfolio Ideas")
+def portfolio_ideas_section():
+    st.header("Portfolio Ideas (Conceptual) 💡")
+    st.caption("Use the selector to view project details and current mock status.")
 
-st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("<br>", unsafe_allow_html=True)
 
-# Project Selector and Display
-project_key = st.selectbox(
-    'Select a Project to View Details:',
-    options=list(projects.keys()),
-    key='project_selector'
-)
-selected_project = projects[project_key]
+    # Project Selector and Display
+    project_key = st.selectbox(
+        'Select a Project to View Details:',
+        options=list(projects.keys()),
+        key='project_selector'
+    )
+    selected_project = projects[project_key]
 
-st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Dynamic Project Display
+    col_img, col_desc = st.columns([1, 2])
+    with col_img:
+        show_mockup(project_key, selected_project["mockup"])
+    with col_desc:
+        st.subheader(project_key)
+        st.write(selected_project["description"])
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.progress(selected_project["status"]["Progress"], text=f"Mock Progress: {int(selected_project['status']['Progress'] * 100)}%")
 
-# Dynamic Project Display
-col_img, col_desc = st.columns([1, 2])
-with col_img:
-    st.image(selected_project["image_url"], caption=f"Mockup for {project_key}")
-with col_desc:
-    st.subheader(project_key)
-    st.write(selected_project["description"])
     st.markdown("<br>", unsafe_allow_html=True)
-    st.progress(selected_project["status"]["Progress"], text=f"Mock Progress: {int(selected_project['status']['Progress'] * 100)}%")
 
-st.markdown("<br>", unsafe_allow_html=True)
+    # Project Status Data (st.dataframe for detail)
+    st.markdown("##### Project Status Details (Data Demonstration):")
+    # A handful of key/value pairs: a markdown table renders them without pulling in pandas
+    status_rows = "\n".join(
+        f"| {attribute} | {value} |" for attribute, value in selected_project["status"].items()
+    )
+    st.markdown(f"| Attribute | Value |\n| --- | --- |\n{status_rows}")
 
-# Project Status Data (st.dataframe for detail)
-st.markdown("##### Project Status Details (Data Demonstration):")
-status_df = pd.DataFrame(
-    list(selected_project["status"].items()), columns=['Attribute', 'Value']
-).set_index('Attribute')
-st.dataframe(status_df, use_container_width=True)
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("---")
+    st.markdown("<br>", unsafe_allow_html=True)
 
-st.markdown("<br>", unsafe_allow_html=True)
-st.markdown("---")
-st.markdown("<br>", unsafe_allow_html=True)
+portfolio_ideas_section()
 
 # 5. DATA VISUALIZATION SECTION
-st.header("🚶 My Cebu Walking Paths (Data Feature) 🗺️")
-st.caption("A simulated visualization of walks between CIT-U, Labangon, and the National Museum.")
+@section_fragment
+@profiled("Map")
+def map_section():
+    st.header("🚶 My Cebu Walking Paths (Data Feature) 🗺️")
+    st.caption("A simulated visualization of walks between CIT-U, Labangon, and the National Museum.")
 
-st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("<br>", unsafe_allow_html=True)
 
-st.map(map_data, zoom=13, use_container_width=True)
-st.caption("The path represents the route from CIT-U to Paseo Arcenas/Sta. Ana Labangon, then on to the National Museum of the Philippines - Cebu, and back towards CIT-U.")
+    # Your own logged walks (GPX, or CSV with lat/lon and optional time columns)
+    uploads = st.file_uploader(
+        "Upload walk tracks (GPX or CSV)",
+        type=["gpx", "csv"],
+        accept_multiple_files=True,
+        key='walk_uploads'
+    )
+    tracks = import_walk_uploads(uploads or [])
+
+    # Only the points that matter at this zoom level are sent to the browser
+    route = get_walk_route()
+    center_lat, center_lon = route.center
+    layers = [pdk.Layer(
+        "PathLayer",
+        data=[{"path": route.path(MAP_ZOOM)}],
+        get_path="path",
+        get_color=hex_to_rgb(VIBRANT_GOLD),
+        width_min_pixels=4,
+        joint_rounded=True,
+    )]
+    if len(tracks):
+        layers.append(pdk.Layer(
+            "PathLayer",
+            data=[{"name": name, "path": tracks.path(i)} for i, name in enumerate(tracks.names)],
+            get_path="path",
+            get_color=hex_to_rgb(ROYAL_BLUE),
+            width_min_pixels=2,
+        ))
+    st.pydeck_chart(
+        pdk.Deck(
+            layers=layers,
+            initial_view_state=pdk.ViewState(latitude=center_lat, longitude=center_lon, zoom=MAP_ZOOM),
+        ),
+        use_container_width=True,
+    )
+    st.caption("The path represents the route from CIT-U to Paseo Arcenas/Sta. Ana Labangon, then on to the National Museum of the Philippines - Cebu, and back towards CIT-U.")
 
-st.markdown("<br>", unsafe_allow_html=True)
-st.markdown("---")
-st.markdown("<br>", unsafe_allow_html=True)
+    if len(tracks):
+        # Distance, duration and pace for every uploaded walk, computed in one vectorized pass
+        walk_stats = tracks.summary()
+        col_walks, col_km, col_min = st.columns(3)
+        col_walks.metric("Walks Logged", len(tracks))
+        col_km.metric("Total Distance (km)", f"{sum(walk_stats['Distance (km)']):.1f}")
+        col_min.metric("Total Time (min)", f"{np.nansum(walk_stats['Duration (min)']):.0f}")
+        st.dataframe(walk_stats, use_container_width=True, hide_index=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("---")
+    st.markdown("<br>", unsafe_allow_html=True)
+
+map_section()
 
 # 6. INTERACTIVE DATA LOGGER
-st.header("🗓️ Daily Focus Tracker (Data Logger) 📝")
-st.caption("Log your mock study time for Python today. This demonstrates `st.time_input` and `st.form` usage.")
+@section_fragment
+@profiled("Data Logger")
+def data_logger_section():
+    st.header("🗓️ Daily Focus Tracker (Data Logger) 📝")
+    st.caption("Log your mock study time for Python today. This demonstrates `st.time_input` and `st.form` usage.")
 
-st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # One shared log for every visitor: the table, the summaries and the export all
+    # read the same store, and no session keeps a copy of it
+    study_store = get_study_log_store()
+
+    with st.form("study_log_form", clear_on_submit=True):
+        # Added padding div for better form appearance
+        st.markdown("<div style='padding: 1rem;'>", unsafe_allow_html=True)
+        col_lang, col_time = st.columns(2)
+        with col_lang:
+            log_language = st.selectbox(
+                'Language Studied:',
+                options=list(st.session_state.languages.keys()),
+                key='log_lang'
+            )
+        with col_time:
+            log_duration = st.number_input(
+                'Study Duration (Hours):',
+                min_value=0.1,
+                max_value=10.0,
+                value=1.0,
+                step=0.5,
+                key='log_duration'
+            )
+
+        st.markdown("<br>", unsafe_allow_html=True)
+        submit_log = st.form_submit_button("Log Study Session")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        if submit_log:
+            study_store.append(datetime.today().date(), log_language, log_duration)
+            st.success("Study session logged!")
 
-if 'study_log' not in st.session_state:
-    st.session_state.study_log = pd.DataFrame({
-        'Date': [datetime.today().date()],
-        'Language': ['Python'],
-        'Duration (hours)': [1.5]
-    })
-
-with st.form("study_log_form", clear_on_submit=True):
-    # Added padding div for better form appearance
-    st.markdown("<div style='padding: 1rem;'>", unsafe_allow_html=True)
-    col_lang, col_time = st.columns(2)
-    with col_lang:
-        log_language = st.selectbox(
-            'Language Studied:',
-            options=list(st.session_state.languages.keys()),
-            key='log_lang'
-        )
-    with col_time:
-        log_duration = st.number_input(
-            'Study Duration (Hours):',
-            min_value=0.1,
-            max_value=10.0,
-            value=1.0,
-            step=0.5,
-            key='log_duration'
-        )
-    
     st.markdown("<br>", unsafe_allow_html=True)
-    submit_log = st.form_submit_button("Log Study Session")
-    st.markdown("</div>", unsafe_allow_html=True)
-
-    if submit_log:
-        new_entry = pd.DataFrame({
-            'Date': [datetime.today().date()],
-            'Language': [log_language],
-            'Duration (hours)': [log_duration]
-        })
-        st.session_state.study_log = pd.concat([st.session_state.study_log, new_entry], ignore_index=True)
-        st.success("Study session logged!")
 
-st.markdown("<br>", unsafe_allow_html=True)
+    # Summary from the store's running totals (kept up to date on every append, no groupby)
+    totals = study_store.totals
+    today = datetime.today().date()
+    language_totals = totals.language_totals()
+    last_week = totals.hours_in_window(today)
+    week_before = totals.hours_in_window(today - timedelta(days=ROLLING_DAYS))
 
-st.markdown("##### Recent Study Log:")
-st.dataframe(st.session_state.study_log.tail(5), use_container_width=True)
+    col_total, col_sessions, col_week, col_top = st.columns(4)
+    col_total.metric("Total Hours", f"{totals.total_hours:.1f}")
+    col_sessions.metric("Sessions", len(totals))
+    col_week.metric("Last 7 Days (h)", f"{last_week:.1f}", delta=f"{last_week - week_before:+.1f}")
+    col_top.metric("Top Language", language_totals.index[0] if len(language_totals) else "—")
 
-st.markdown("<br>", unsafe_allow_html=True)
-st.markdown("---")
-st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    col_log, col_charts = st.columns([1, 1])
+    with col_log:
+        st.markdown("##### Recent Study Log:")
+        # Indexed LIMIT read from the store instead of scanning the whole log
+        st.dataframe(study_store.recent(5), use_container_width=True, hide_index=True)
+    with col_charts:
+        st.markdown("##### Hours per Language:")
+        st.bar_chart(language_totals[HOURS_COL], color=VIBRANT_GOLD)
+        st.markdown("##### Daily Hours (last 4 weeks):")
+        st.line_chart(totals.daily_totals(today), color=[ROYAL_BLUE, VIBRANT_GOLD])
+
+    # Export is only written when the download is clicked (a deferred download runs the
+    # callable then), batch by batch from the store; reruns never build it
+    st.markdown("<br>", unsafe_allow_html=True)
+    col_format, col_export = st.columns([1, 1])
+    with col_format:
+        export_format = st.selectbox("Export format:", list(EXPORT_FORMATS), key='study_export_format')
+    _, export_name, export_mime = EXPORT_FORMATS[export_format]
+    with col_export:
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.download_button(
+            f"⬇️ Download {export_name}",
+            data=lambda: export_study_log(study_store, export_format),
+            file_name=export_name,
+            mime=export_mime,
+            key='study_export_download',
+            use_container_width=True,
+        )
+
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("---")
+    st.markdown("<br>", unsafe_allow_html=True)
+
+data_logger_section()
 
 # 7. SKILL BOOSTER (INTERACTIVE COMPONENT)
-st.header("✨ Today I Learned: Skill Booster (Interactive Component) 🚀")
-st.caption("Select a skill you focused on today and give yourself +5 points!")
+@section_fragment
+@profiled("Skill Booster")
+def skill_booster_section():
+    st.header("✨ Today I Learned: Skill Booster (Interactive Component) 🚀")
+    st.caption("Select a skill you focused on today and give yourself +5 points!")
+    if 'boost_toast' in st.session_state:
+        st.toast(st.session_state.pop('boost_toast'), icon="🚀")
 
-st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("<br>", unsafe_allow_html=True)
 
-# Get list of languages for the selectbox
-language_options = list(st.session_state.languages.keys())
+    # Get list of languages for the selectbox
+    language_options = list(st.session_state.languages.keys())
 
-# Interactive Widgets
-col_sel, col_btn = st.columns([4, 1])
+    # Interactive Widgets
+    col_sel, col_btn = st.columns([4, 1])
 
-with col_sel:
-    selected_language = st.selectbox(
-        'Which language did you focus on today?',
-        options=language_options,
-        index=language_options.index("Python"),
-        key='plus_point_selector'
-    )
+    with col_sel:
+        selected_language = st.selectbox(
+            'Which language did you focus on today?',
+            options=language_options,
+            # Python unless content.toml no longer lists it
+            index=language_options.index("Python") if "Python" in language_options else 0,
+            key='plus_point_selector'
+        )
 
-with col_btn:
-    st.markdown("<br>", unsafe_allow_html=True) # Spacer for button alignment
-    if st.button(f'+5 Boost to {selected_language}', use_container_width=True):
-        update_score_add(selected_language)
+    with col_btn:
+        st.markdown("<br>", unsafe_allow_html=True) # Spacer for button alignment
+        if st.button(f'+5 Boost to {selected_language}', use_container_width=True):
+            if update_score_add(selected_language):
+                # The Skills section's chart and grid live in another fragment; rerun the
+                # whole page so they show the new score too
+                if USE_FRAGMENTS and _fragment is not None:
+                    st.rerun(scope="app")
+                st.toast(st.session_state.pop('boost_toast'), icon="🚀")
 
-st.markdown("<br>", unsafe_allow_html=True)
-        
-# Re-draw the skill chart immediately after the simulator for visual feedback
-st.markdown("##### Updated Skill Level Visualization:")
-df_updated_skills_chart = pd.DataFrame(
-    list(st.session_state.languages.items()), columns=['Language', 'Experience Score (out of 100)']
-).set_index('Language')
+    st.markdown("<br>", unsafe_allow_html=True)
 
-# Bar chart uses VIBRANT_GOLD
-boost_color = VIBRANT_GOLD 
-st.bar_chart(df_updated_skills_chart, use_container_width=True, color=boost_color) 
+    # Re-draw the skill chart immediately after the simulator for visual feedback
+    st.markdown("##### Updated Skill Level Visualization:")
+    # Same memoized frame as the Skills section; only rebuilt if the boost above changed a score
+    df_updated_skills_chart = st.session_state.languages.frame()
+
+    # Bar chart uses VIBRANT_GOLD
+    boost_color = VIBRANT_GOLD 
+    st.bar_chart(df_updated_skills_chart, use_container_width=True, color=boost_color) 
+
+    # Across all visitors (and replicas sharing the store); read from a cache refreshed every few seconds
+    st.markdown("##### 🔥 Most Boosted Today (All Visitors):")
+    most_boosted = get_boost_counter().top(5)
+    if most_boosted:
+        st.dataframe(
+            [{"Language": language, "Boosts": count} for language, count in most_boosted],
+            use_container_width=True,
+            hide_index=True,
+        )
+    else:
+        st.caption("No boosts yet today. Be the first!")
+
+    # Boost history from the per-language ring buffers, downsampled (LTTB) so the
+    # chart never draws more than a few hundred points per language
+    st.markdown("##### Skill Growth Over Time:")
+    trend = st.session_state.languages.trend_frame()
+    if len(trend):
+        st.line_chart(trend, x=TIME_COL, y=SCORE_COL, color='Language', use_container_width=True)
+    else:
+        st.caption("Boost a skill to start its growth history.")
 
-st.markdown("<br>", unsafe_allow_html=True)
-st.markdown("---")
-st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("---")
+    st.markdown("<br>", unsafe_allow_html=True)
+
+skill_booster_section()
 
 # 8. CONTACT ME SECTION
-st.header("Get In Touch 📧")
-# Dynamic colors for contact section (fixed to dark theme's colors)
-contact_color = LIGHT_GRAY_TEXT 
-link_color = VIBRANT_GOLD 
-accent_color = ROYAL_BLUE 
-
-st.markdown(f"""
-<div style='font-size: 1.1rem; line-height: 2;'>
-<p style='color: {accent_color}; margin-bottom: 1rem;'>
-    🔗 GitHub: <a href="https://github.com/martianK3jC" target="_blank" style="color: {link_color}; text-decoration: none;">martianK3jC</a>
-</p>
-<p style='color: {accent_color}; margin-bottom: 1rem;'>
-    💼 LinkedIn: <a href="https://www.linkedin.com/in/kesha-jane-ceniza-88923b38b/" target="_blank" style="color: {link_color}; text-decoration: none;">Kesha Jane L. Ceniza</a>
-</p>
-<p style='color: {accent_color}; margin-bottom: 1rem;'>
-    ✉️ Email: <a href="mailto:keshajane24@gmail.com" style="color: {link_color}; text-decoration: none;">keshajane24@gmail.com</a>
-</p>
-</div>
-""", unsafe_allow_html=True)
+@profiled("Contact")
+def contact_section():
+    st.header("Get In Touch 📧")
+    # Dynamic colors for contact section (fixed to dark theme's colors)
+    contact_color = LIGHT_GRAY_TEXT 
+    link_color = VIBRANT_GOLD 
+    accent_color = ROYAL_BLUE 
+
+    st.markdown(f"""
+    <div style='font-size: 1.1rem; line-height: 2;'>
+    <p style='color: {accent_color}; margin-bottom: 1rem;'>
+        🔗 GitHub: <a href="https://github.com/martianK3jC" target="_blank" style="color: {link_color}; text-decoration: none;">martianK3jC</a>
+    </p>
+    <p style='color: {accent_color}; margin-bottom: 1rem;'>
+        💼 LinkedIn: <a href="https://www.linkedin.com/in/kesha-jane-ceniza-88923b38b/" target="_blank" style="color: {link_color}; text-decoration: none;">Kesha Jane L. Ceniza</a>
+    </p>
+    <p style='color: {accent_color}; margin-bottom: 1rem;'>
+        ✉️ Email: <a href="mailto:keshajane24@gmail.com" style="color: {link_color}; text-decoration: none;">keshajane24@gmail.com</a>
+    </p>
+    </div>
+    """, unsafe_allow_html=True)
 
-st.markdown("<br>", unsafe_allow_html=True)
-st.markdown("---")
-st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("---")
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Fixed footer text
+    st.markdown(f"<p style='text-align: center; color: {MEDIUM_GRAY_NEUTRAL};'>Built with Streamlit 🎈</p>", unsafe_allow_html=True)
+
+contact_section()
 
-# Fixed footer text
-st.markdown(f"<p style='text-align: center; color: {MEDIUM_GRAY_NEUTRAL};'>Built with Streamlit 🎈</p>", unsafe_allow_html=True)
\ No newline at end of file
+# Hidden per-section timing and session memory panel (?debug=1)
+render_debug_panel(process_stats=session_memory.stats)
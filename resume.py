@@ -0,0 +1,172 @@
+import json
+
+# --- RESUME EXPORT ---
+# Every format is produced only when someone asks for it and cached for the
+# loaded content, so an unchanged content file never re-renders a format twice.
+
+
+def resume_txt(content):
+    resume = content.resume
+    project_lines = "\n\n".join(
+        f"{i}. {name}\n    - {project.get('summary', project['description'])}"
+        for i, (name, project) in enumerate(content.projects.items(), start=1)
+    )
+    return f"""
+========================================
+          PORTFOLIO RESUME
+========================================
+
+Name: {resume.get('name', '')}
+Title: {resume.get('title', '')}
+University: {resume.get('university', '')}
+Year: {resume.get('year', '')}
+
+========================================
+          TECHNICAL SKILLS
+========================================
+{', '.join(content.languages.keys())}
+
+========================================
+          PROJECT IDEAS
+========================================
+{project_lines}
+
+========================================
+          CONTACT
+========================================
+Email: {resume.get('email', '')}
+GitHub: {resume.get('github', '')}
+LinkedIn: {resume.get('linkedin', '')}
+
+========================================
+"""
+
+
+def resume_markdown(content):
+    resume = content.resume
+    lines = [
+        f"# {resume.get('name', '')}",
+        "",
+        f"**{resume.get('title', '')}**  ",
+        f"{resume.get('university', '')} · {resume.get('year', '')}",
+        "",
+        "## Technical Skills",
+        "",
+        ", ".join(content.languages.keys()),
+        "",
+        "## Project Ideas",
+        "",
+    ]
+    for name, project in content.projects.items():
+        lines += [f"### {name}", "", project["description"], ""]
+    lines += ["## Contact", ""]
+    if resume.get("email"):
+        lines.append(f"- Email: [{resume['email']}](mailto:{resume['email']})")
+    if resume.get("github"):
+        lines.append(f"- GitHub: [{resume['github']}](https://github.com/{resume['github']})")
+    if resume.get("linkedin"):
+        lines.append(f"- LinkedIn: {resume['linkedin']}")
+    return "\n".join(lines) + "\n"
+
+
+# https://jsonresume.org/schema (v1.0.0)
+def resume_json(content):
+    resume = content.resume
+    profiles = []
+    if resume.get("github"):
+        profiles.append({"network": "GitHub", "username": resume["github"],
+                         "url": f"https://github.com/{resume['github']}"})
+    if resume.get("linkedin"):
+        profiles.append({"network": "LinkedIn", "username": resume["linkedin"]})
+    document = {
+        "$schema": "https://raw.githubusercontent.com/jsonresume/resume-schema/v1.0.0/schema.json",
+        "basics": {
+            "name": resume.get("name", ""),
+            "label": resume.get("title", ""),
+            "email": resume.get("email", ""),
+            "profiles": profiles,
+        },
+        "education": [{"institution": resume.get("university", ""), "studyType": resume.get("year", "")}],
+        "skills": [{"name": name, "level": f"{score}/100"} for name, score in content.languages.items()],
+        "projects": [{"name": name, "description": project["description"]}
+                     for name, project in content.projects.items()],
+    }
+    return json.dumps(document, indent=2, ensure_ascii=False) + "\n"
+
+
+# --- Minimal PDF writer: the TXT layout in Courier, no external dependencies ---
+PDF_PAGE_WIDTH, PDF_PAGE_HEIGHT = 612, 792  # US Letter, points
+PDF_MARGIN = 72
+PDF_FONT_SIZE = 10
+PDF_LEADING = 14
+PDF_LINES_PER_PAGE = (PDF_PAGE_HEIGHT - 2 * PDF_MARGIN) // PDF_LEADING
+
+
+def _pdf_text(line):
+    # Standard fonts only cover Latin-1; anything else (e.g. emoji) becomes "?"
+    text = line.encode("latin-1", "replace").decode("latin-1")
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def resume_pdf(content):
+    lines = resume_txt(content).splitlines()
+    pages = [lines[i:i + PDF_LINES_PER_PAGE] for i in range(0, len(lines), PDF_LINES_PER_PAGE)] or [[]]
+
+    # Object numbers: 1 catalog, 2 page tree, 3 font, then a (page, content) pair per page
+    objects = {3: "<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding /WinAnsiEncoding >>"}
+    page_refs = []
+    for i, page in enumerate(pages):
+        page_obj, content_obj = 4 + 2 * i, 5 + 2 * i
+        page_refs.append(f"{page_obj} 0 R")
+        stream = "\n".join(
+            [f"BT /F1 {PDF_FONT_SIZE} Tf {PDF_LEADING} TL {PDF_MARGIN} {PDF_PAGE_HEIGHT - PDF_MARGIN} Td"]
+            + [f"({_pdf_text(line)}) '" for line in page]
+            + ["ET"]
+        )
+        objects[content_obj] = f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream"
+        objects[page_obj] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PDF_PAGE_WIDTH} {PDF_PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_obj} 0 R >>"
+        )
+    objects[1] = "<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(page_refs)}] /Count {len(pages)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = len(out)
+        out += f"{number} 0 obj\n{objects[number]}\nendobj\n".encode("latin-1")
+    xref_at = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for number in sorted(objects):
+        out += f"{offsets[number]:010d} 00000 n \n".encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode("latin-1")
+    return bytes(out)
+
+
+# Format -> (renderer, file name, MIME type)
+RESUME_FORMATS = {
+    "TXT": (resume_txt, "portfolio_resume.txt", "text/plain"),
+    "Markdown": (resume_markdown, "portfolio_resume.md", "text/markdown"),
+    "JSON Resume": (resume_json, "portfolio_resume.json", "application/json"),
+    "PDF": (resume_pdf, "portfolio_resume.pdf", "application/pdf"),
+}
+
+
+# format -> (content, bytes). The content loader hands every session the same
+# Content object until content.toml changes, so the object itself identifies the
+# version: a new object simply replaces the entry (and the old content with it).
+_cache = {}
+
+
+# (bytes, file name, MIME type) for one format, rendered at most once per content version
+def export_resume(content, fmt):
+    renderer, file_name, mime = RESUME_FORMATS[fmt]
+    cached = _cache.get(fmt)
+    if cached is not None and cached[0] is content:
+        return cached[1], file_name, mime
+    data = renderer(content)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    _cache[fmt] = (content, data)
+    return data, file_name, mime
@@ -0,0 +1,111 @@
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# --- ROUTE GEOMETRY (walking-path map) ---
+# Zoom levels we precompute simplified routes for (web-mercator zoom, as in st.map/pydeck)
+MIN_ZOOM = 0
+MAX_ZOOM = 20
+# A point is dropped at a zoom level when it moves the line by less than this many pixels
+TOLERANCE_PX = 1.0
+
+EARTH_METERS_PER_DEG_LAT = 110_540.0
+EARTH_METERS_PER_DEG_LON = 111_320.0  # at the equator, scaled by cos(latitude)
+WEB_MERCATOR_M_PER_PX_Z0 = 156_543.03392  # ground resolution at zoom 0 on the equator
+
+
+# Polyline through `anchors` ((k, 2) lat/lon) with `steps[i]` evenly spaced points
+# on leg i (the leg's start point excluded), built without any Python loop.
+def build_polyline(anchors, steps):
+    anchors = np.asarray(anchors, dtype=np.float64)
+    steps = np.asarray(steps, dtype=np.int64)
+    leg = np.repeat(np.arange(len(steps)), steps)
+    leg_start = np.repeat(np.cumsum(steps) - steps, steps)
+    t = ((np.arange(len(leg)) - leg_start + 1) / steps[leg])[:, None]
+    points = anchors[leg] + (anchors[leg + 1] - anchors[leg]) * t
+    return np.vstack([anchors[:1], points])
+
+
+# Local planar projection in meters, good enough for city-scale routes
+def _to_meters(points):
+    lat0 = np.radians(points[:, 0].mean())
+    return np.column_stack([
+        points[:, 0] * EARTH_METERS_PER_DEG_LAT,
+        points[:, 1] * EARTH_METERS_PER_DEG_LON * np.cos(lat0),
+    ])
+
+
+# Douglas-Peucker run to the bottom without a tolerance: every point gets the
+# distance (in meters) at which it would be split off, clamped so a point is never
+# more important than the point that split its parent segment. Simplifying for any
+# tolerance is then just `importance >= tolerance`.
+def douglas_peucker_importance(points):
+    n = len(points)
+    importance = np.zeros(n)
+    if n == 0:
+        return importance
+    importance[0] = importance[-1] = np.inf
+    xy = _to_meters(points)
+    stack = [(0, n - 1, np.inf)]
+    while stack:
+        start, end, ceiling = stack.pop()
+        if end - start < 2:
+            continue
+        a, b = xy[start], xy[end]
+        inner = xy[start + 1:end]
+        ab = b - a
+        length = np.hypot(ab[0], ab[1])
+        if length == 0:
+            dist = np.hypot(inner[:, 0] - a[0], inner[:, 1] - a[1])
+        else:
+            dist = np.abs(ab[0] * (inner[:, 1] - a[1]) - ab[1] * (inner[:, 0] - a[0])) / length
+        i = int(np.argmax(dist))
+        split = start + 1 + i
+        importance[split] = min(dist[i], ceiling)
+        stack.append((start, split, importance[split]))
+        stack.append((split, end, importance[split]))
+    return importance
+
+
+def meters_per_pixel(zoom, latitude):
+    return WEB_MERCATOR_M_PER_PX_Z0 * np.cos(np.radians(latitude)) / (2 ** zoom)
+
+
+class Route:
+    def __init__(self, points):
+        self.points = np.asarray(points, dtype=np.float64)
+        self.importance = douglas_peucker_importance(self.points)
+        latitude = self.points[:, 0].mean() if len(self.points) else 0.0
+        # Indices of the points kept at each zoom level, precomputed once
+        self.levels = {
+            zoom: np.flatnonzero(self.importance >= TOLERANCE_PX * meters_per_pixel(zoom, latitude))
+            for zoom in range(MIN_ZOOM, MAX_ZOOM + 1)
+        }
+
+    def __len__(self):
+        return len(self.points)
+
+    @property
+    def center(self):
+        lo, hi = self.points.min(axis=0), self.points.max(axis=0)
+        return (lo + hi) / 2
+
+    # Simplified (lat, lon) points for a zoom level, optionally cropped to a
+    # (south, west, north, east) box so only the visible part is sent
+    def at_zoom(self, zoom, bounds=None):
+        zoom = int(min(max(round(zoom), MIN_ZOOM), MAX_ZOOM))
+        points = self.points[self.levels[zoom]]
+        if bounds is not None:
+            south, west, north, east = bounds
+            inside = ((points[:, 0] >= south) & (points[:, 0] <= north)
+                      & (points[:, 1] >= west) & (points[:, 1] <= east))
+            # Keep each visible point's neighbours so segments crossing the edge still draw
+            keep = inside.copy()
+            keep[1:] |= inside[:-1]
+            keep[:-1] |= inside[1:]
+            points = points[keep]
+        return points
+
+    # [[lon, lat], ...] path as expected by pydeck's PathLayer
+    def path(self, zoom, bounds=None):
+        return self.at_zoom(zoom, bounds)[:, ::-1].tolist()
@@ -0,0 +1,97 @@
+import time
+
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# --- SKILL SCORE HISTORY ---
+# Scores are recorded per language into fixed-size ring buffers, so a session's
+# history never grows past HISTORY_CAPACITY points per language, and trend charts
+# are downsampled to at most TREND_POINTS points however long the history is.
+HISTORY_CAPACITY = 1024  # ~10 KiB per boosted language
+TREND_POINTS = 200
+
+
+# Two preallocated arrays (timestamp, score); the oldest point is overwritten once full
+class ScoreRing:
+    def __init__(self, capacity=HISTORY_CAPACITY):
+        self.times = np.empty(capacity, dtype=np.float64)  # seconds since the epoch
+        self.scores = np.empty(capacity, dtype=np.int16)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, timestamp, score):
+        capacity = len(self.times)
+        slot = (self._start + self._size) % capacity
+        self.times[slot] = timestamp
+        self.scores[slot] = score
+        if self._size < capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % capacity
+
+    # (times, scores), oldest first
+    def arrays(self):
+        end = self._start + self._size
+        if end <= len(self.times):
+            return self.times[self._start:end], self.scores[self._start:end]
+        wrap = end - len(self.times)
+        return (np.concatenate((self.times[self._start:], self.times[:wrap])),
+                np.concatenate((self.scores[self._start:], self.scores[:wrap])))
+
+
+# Largest-Triangle-Three-Buckets: indices of `threshold` points that keep the shape
+# of the (x, y) line. First and last points are always kept.
+def lttb(x, y, threshold):
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    y = y.astype(np.float64)
+    keep = np.empty(threshold, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    # threshold - 2 buckets over the points between the first and the last
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x, avg_y = x[next_lo:next_hi].mean(), y[next_lo:next_hi].mean()
+        # Twice the triangle area between the last kept point, each candidate and the next bucket's average
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+class SkillHistory:
+    def __init__(self, capacity=HISTORY_CAPACITY):
+        self.capacity = capacity
+        self.rings = {}
+
+    def __contains__(self, language):
+        return language in self.rings
+
+    def record(self, language, score, timestamp=None):
+        ring = self.rings.get(language)
+        if ring is None:
+            ring = self.rings[language] = ScoreRing(self.capacity)
+        ring.append(time.time() if timestamp is None else timestamp, score)
+
+    def discard(self, language):
+        self.rings.pop(language, None)
+
+    @property
+    def nbytes(self):
+        return sum(ring.times.nbytes + ring.scores.nbytes for ring in self.rings.values())
+
+    # {language: (times, scores)} with at most max_points points per language
+    def trend(self, max_points=TREND_POINTS):
+        result = {}
+        for language, ring in self.rings.items():
+            times, scores = ring.arrays()
+            keep = lttb(times, scores, max_points)
+            result[language] = (times[keep], scores[keep])
+        return result
@@ -0,0 +1,215 @@
+import atexit
+import logging
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import weakref
+import zlib
+
+try:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+except ImportError:  # older Streamlit releases
+    from streamlit.scriptrunner import get_script_run_ctx
+
+# --- SESSION MEMORY (idle spill-to-disk) ---
+# Every session's heavy state (SPILL_KEYS) is measured on each interaction. A
+# session idle for longer than PORTFOLIO_SPILL_IDLE seconds has those keys
+# pickled and compressed to a file and removed from memory. Its next interaction
+# loads them back before anything reads them.
+# PORTFOLIO_SESSION_MEMORY_CAP_MB additionally spills the least recently active
+# sessions whenever the tracked total goes over the cap.
+SPILL_KEYS = ("languages", "walk_tracks")
+IDLE_SECONDS = float(os.environ.get("PORTFOLIO_SPILL_IDLE", "600"))  # 0 disables idle spilling
+MEMORY_CAP_BYTES = int(float(os.environ.get("PORTFOLIO_SESSION_MEMORY_CAP_MB", "0")) * 1024 * 1024)  # 0: no cap
+SPILL_ROOT = os.environ.get("PORTFOLIO_SPILL_DIR") or None  # None: the system temp directory
+SWEEP_INTERVAL = 30.0
+# Never spill a session to meet the cap if it was active this recently
+MIN_IDLE_FOR_CAP = 30.0
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_nbytes(value):
+    nbytes = getattr(value, "nbytes", None)
+    return int(nbytes) if nbytes is not None else sys.getsizeof(value)
+
+
+# Kept in each session's state under TOKEN_KEY. The manager only holds it weakly,
+# so it dies with the session. It carries the state and the lock of the wrapper
+# (ctx.session_state) of the session's latest script run; every change the
+# sweeper makes to the state happens under that lock.
+TOKEN_KEY = "_session_memory"
+
+
+class _StateToken:
+    __slots__ = ("state", "lock", "__weakref__")
+
+    def __init__(self, state, lock):
+        self.state = state
+        self.lock = lock
+
+
+class _Session:
+    def __init__(self, token):
+        self.token = weakref.ref(token)
+        self.last_active = time.monotonic()
+        self.nbytes = 0
+        self.spill_path = None
+        self.spilled_bytes = 0
+
+
+class SessionMemoryManager:
+    def __init__(self, keys=SPILL_KEYS, idle_seconds=IDLE_SECONDS, cap_bytes=MEMORY_CAP_BYTES,
+                 spill_root=SPILL_ROOT, sweep_interval=SWEEP_INTERVAL):
+        self.keys = keys
+        self.idle_seconds = idle_seconds
+        self.cap_bytes = cap_bytes
+        self.sweep_interval = sweep_interval
+        # Spill files only mean something to this process, so each process gets its own directory
+        if spill_root:
+            os.makedirs(spill_root, exist_ok=True)
+        self.spill_dir = tempfile.mkdtemp(prefix="portfolio-sessions-", dir=spill_root)
+        atexit.register(shutil.rmtree, self.spill_dir, True)
+        self.spills = 0
+        self.restores = 0
+        self._sessions = {}
+        self._lock = threading.RLock()
+        self._sweeper = None
+
+    # Call before the script (or a fragment) reads any spilled key: registers the
+    # session, restores its state if it was spilled and marks it active
+    def touch(self):
+        ctx = get_script_run_ctx()
+        if ctx is None:
+            return
+        safe_state = ctx.session_state
+        with self._lock, safe_state._lock:
+            state = safe_state._state
+            session = self._sessions.get(ctx.session_id)
+            token = session.token() if session is not None else None
+            if token is None or token.state is not state:
+                token = state[TOKEN_KEY] = _StateToken(state, safe_state._lock)
+                session = self._sessions[ctx.session_id] = _Session(token)
+            # Every script run wraps the same state in a new wrapper with its own lock
+            token.lock = safe_state._lock
+            if session.spill_path is not None:
+                self._restore(session, state)
+            session.last_active = time.monotonic()
+            session.nbytes = self._measure(state)
+            self._start_sweeper()
+        if self.cap_bytes:
+            self.enforce_cap()
+
+    def _measure(self, state):
+        return sum(estimate_nbytes(state[key]) for key in self.keys if key in state)
+
+    # Runs on the sweeper thread (or another session's), so it goes through the raw
+    # state under the wrapper's lock: the wrapper's own methods would run the
+    # session's execution-control callback on this thread.
+    def _spill(self, session_id, session):
+        token = session.token()
+        if token is None or session.spill_path is not None:
+            return
+        with token.lock:
+            self._spill_locked(session_id, session, token.state)
+
+    def _spill_locked(self, session_id, session, state):
+        payload = {key: state[key] for key in self.keys if key in state}
+        if not payload:
+            return
+        path = os.path.join(self.spill_dir, f"{session_id}.pkl.z")
+        data = zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        for key in payload:
+            del state[key]
+        session.spill_path, session.spilled_bytes, session.nbytes = path, len(data), 0
+        self.spills += 1
+
+    def _restore(self, session, state):
+        with open(session.spill_path, "rb") as f:
+            payload = pickle.loads(zlib.decompress(f.read()))
+        for key, value in payload.items():
+            state[key] = value
+        os.remove(session.spill_path)
+        session.spill_path, session.spilled_bytes = None, 0
+        self.restores += 1
+
+    def _forget(self, session_id, session):
+        if session.spill_path is not None:
+            try:
+                os.remove(session.spill_path)
+            except FileNotFoundError:
+                pass
+        del self._sessions[session_id]
+
+    # Re-measure live sessions, drop closed ones and spill the idle ones
+    def sweep(self):
+        now = time.monotonic()
+        with self._lock:
+            for session_id, session in list(self._sessions.items()):
+                token = session.token()
+                if token is None:
+                    self._forget(session_id, session)
+                elif session.spill_path is None:
+                    with token.lock:
+                        session.nbytes = self._measure(token.state)
+                    if self.idle_seconds and now - session.last_active > self.idle_seconds:
+                        self._spill(session_id, session)
+        if self.cap_bytes:
+            self.enforce_cap()
+
+    # Spill least recently active sessions until the in-memory total fits the cap
+    def enforce_cap(self):
+        now = time.monotonic()
+        with self._lock:
+            total = sum(session.nbytes for session in self._sessions.values())
+            candidates = sorted(
+                (item for item in self._sessions.items()
+                 if item[1].spill_path is None and now - item[1].last_active > MIN_IDLE_FOR_CAP),
+                key=lambda item: item[1].last_active,
+            )
+            for session_id, session in candidates:
+                if total <= self.cap_bytes:
+                    break
+                freed = session.nbytes
+                self._spill(session_id, session)
+                if session.spill_path is not None:
+                    total -= freed
+
+    def _start_sweeper(self):
+        if self._sweeper is not None:
+            return
+
+        def run():
+            while True:
+                time.sleep(self.sweep_interval)
+                try:
+                    self.sweep()
+                except Exception:  # keep sweeping; one bad session shouldn't stop it
+                    logger.exception("Session memory sweep failed")
+
+        self._sweeper = threading.Thread(target=run, name="session-memory-sweeper", daemon=True)
+        self._sweeper.start()
+
+    # Process-wide totals (for the debug panel and logs)
+    def stats(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+        in_memory = [s for s in sessions if s.spill_path is None]
+        return {
+            "sessions": len(sessions),
+            "in_memory": len(in_memory),
+            "spilled": len(sessions) - len(in_memory),
+            "memory_kib": round(sum(s.nbytes for s in in_memory) / 1024, 1),
+            "largest_session_kib": round(max((s.nbytes for s in in_memory), default=0) / 1024, 1),
+            "spilled_kib": round(sum(s.spilled_bytes for s in sessions) / 1024, 1),
+            "spills": self.spills,
+            "restores": self.restores,
+        }
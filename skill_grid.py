@@ -0,0 +1,62 @@
+import html
+from functools import lru_cache
+
+# --- SKILL PROGRESS GRID ---
+DEFAULT_CATEGORY = "Other"
+SORT_OPTIONS = ("Default", "Score (high to low)", "Score (low to high)", "Name (A to Z)")
+
+
+# Filter and sort (name, score) pairs, then group them by category.
+# Returns [(category, [(name, score), ...]), ...] with categories in first-seen order.
+def group_skills(scores, categories, query="", selected=(), sort="Default"):
+    query = query.strip().lower()
+    rows = [
+        (name, score, categories.get(name, DEFAULT_CATEGORY))
+        for name, score in scores
+        if query in name.lower()
+    ]
+    if selected:
+        rows = [row for row in rows if row[2] in selected]
+    if sort == "Default":
+        # Order of the category mapping, then anything uncategorized
+        position = {name: i for i, name in enumerate(categories)}
+        rows.sort(key=lambda row: position.get(row[0], len(position)))
+    elif sort == "Score (high to low)":
+        rows.sort(key=lambda row: -row[1])
+    elif sort == "Score (low to high)":
+        rows.sort(key=lambda row: row[1])
+    elif sort == "Name (A to Z)":
+        rows.sort(key=lambda row: row[0].lower())
+
+    grouped = {}
+    for name, score, category in rows:
+        grouped.setdefault(category, []).append((name, score))
+    return list(grouped.items())
+
+
+# Every category card and progress bar as one HTML element. `scores` is a tuple of
+# (name, score) pairs so the result can be cached per score version and filter.
+@lru_cache(maxsize=64)
+def render_skill_grid_html(scores, categories, query, selected, sort,
+                           bar_color, track_color, text_color, heading_color):
+    groups = group_skills(scores, dict(categories), query, selected, sort)
+    if not groups:
+        return f"<p style='color: {text_color};'>No skills match this filter.</p>"
+    cards = []
+    for category, skills in groups:
+        bars = "".join(
+            f"<div style='margin-bottom: 1rem;'>"
+            f"<div style='color: {text_color}; font-size: 0.9rem; margin-bottom: 0.35rem;'>{html.escape(name)} ({score}%)</div>"
+            f"<div style='background-color: {track_color}; border-radius: 4px; height: 0.5rem;'>"
+            f"<div style='background-color: {bar_color}; border-radius: 4px; height: 100%; width: {min(max(score, 0), 100)}%;'></div>"
+            f"</div></div>"
+            for name, score in skills
+        )
+        cards.append(
+            f"<div><h3 style='color: {heading_color};'>{html.escape(category)}</h3>{bars}</div>"
+        )
+    return (
+        "<div style='display: grid; grid-template-columns: repeat(auto-fill, minmax(260px, 1fr)); column-gap: 2rem;'>"
+        + "".join(cards)
+        + "</div>"
+    )
@@ -0,0 +1,120 @@
+import sys
+from collections.abc import Mapping
+
+from lazy import lazy_import
+from score_history import SkillHistory, TREND_POINTS
+
+pd = lazy_import("pandas")
+
+# --- SKILL SCORES ---
+MAX_SCORE = 100
+SCORE_COL = 'Experience Score (out of 100)'
+TIME_COL = 'Time'
+
+# (baseline, frame) for sessions without boosts. The content loader hands every
+# session the same baseline mapping until content.toml changes, so the object
+# itself identifies the version and one shared frame serves them all.
+_baseline_frame = None
+
+
+def _scores_frame(scores):
+    return pd.DataFrame(list(scores.items()), columns=['Language', SCORE_COL]).set_index('Language')
+
+
+# Per-session scores as a thin overlay on the shared baseline. Only the
+# languages a visitor has boosted are stored, so a fresh session costs one
+# empty dict and can never write through to another session's numbers.
+class SkillScores(Mapping):
+    def __init__(self, baseline):
+        self.baseline = baseline
+        self.deltas = {}
+        # Bumped on every change so views built from the scores know when they are stale
+        self.version = 0
+        self._frame = None
+        self._frame_version = None
+        # Every boost, per language, for the trend chart
+        self.history = SkillHistory()
+        self._trend = None
+        self._trend_version = None
+
+    def __getitem__(self, language):
+        return min(self.baseline[language] + self.deltas.get(language, 0), MAX_SCORE)
+
+    def __iter__(self):
+        return iter(self.baseline)
+
+    def __len__(self):
+        return len(self.baseline)
+
+    # Approximate memory held by this session's scores (the baseline is shared)
+    @property
+    def nbytes(self):
+        total = sys.getsizeof(self.deltas) + self.history.nbytes
+        if self._frame is not None:
+            total += int(self._frame.memory_usage(deep=True).sum())
+        if self._trend is not None:
+            total += int(self._trend.memory_usage(deep=True).sum())
+        return total
+
+    # For spilling to disk: the shared baseline is a read-only view that can't be
+    # pickled, so a plain copy goes instead (the next full rerun rebases onto the
+    # shared one again) and the cached frames are rebuilt on demand
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update(baseline=dict(self.baseline), _frame=None, _frame_version=None,
+                     _trend=None, _trend_version=None)
+        return state
+
+    # Add points (capped at MAX_SCORE) and return the new score
+    def boost(self, language, points=5):
+        if language not in self.history:
+            # Start the trend from the score before the first boost
+            self.history.record(language, self[language])
+        score = min(self[language] + points, MAX_SCORE)
+        self.deltas[language] = score - self.baseline[language]
+        self.history.record(language, score)
+        self.version += 1
+        return score
+
+    # Switch to a new shared baseline (e.g. after the content file was edited),
+    # keeping this session's boosts for skills that still exist
+    def rebase(self, baseline):
+        self.deltas = {language: delta for language, delta in self.deltas.items() if language in baseline}
+        for language in list(self.history.rings):
+            if language not in baseline:
+                self.history.discard(language)
+        self.baseline = baseline
+        self.version += 1
+
+    # Language -> score DataFrame shared by the charts, progress grid and raw data
+    # expander. Sessions without boosts share one baseline frame; a private frame is
+    # built only after a boost, once per score version.
+    def frame(self):
+        global _baseline_frame
+        if not self.deltas:
+            self._frame = None
+            cached = _baseline_frame
+            if cached is None or cached[0] is not self.baseline:
+                cached = _baseline_frame = (self.baseline, _scores_frame(self))
+            return cached[1]
+        if self._frame is None or self._frame_version != self.version:
+            self._frame = _scores_frame(self)
+            self._frame_version = self.version
+        return self._frame
+
+    # Long-form (time, language, score) DataFrame of the boost history, downsampled
+    # to at most `max_points` points per language and rebuilt once per score version
+    def trend_frame(self, max_points=TREND_POINTS):
+        if self._trend is None or self._trend_version != (self.version, max_points):
+            parts = [
+                pd.DataFrame({
+                    TIME_COL: pd.to_datetime(times, unit='s'),
+                    'Language': language,
+                    SCORE_COL: scores,
+                })
+                for language, (times, scores) in self.history.trend(max_points).items()
+            ]
+            self._trend = (pd.concat(parts, ignore_index=True) if parts
+                           else pd.DataFrame(columns=[TIME_COL, 'Language', SCORE_COL]))
+            self._trend_version = (self.version, max_points)
+        return self._trend
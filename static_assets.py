@@ -0,0 +1,47 @@
+import hashlib
+import os
+import re
+
+import streamlit as st
+
+# --- GENERATED STATIC ASSETS ---
+# Files written here are served by Streamlit's static file serving
+# (server.enableStaticServing in .streamlit/config.toml) at app/static/generated/.
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+GENERATED_DIR = os.path.join(STATIC_DIR, "generated")
+STATIC_URL = "app/static/generated"
+
+
+def static_serving_enabled():
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except RuntimeError:  # option unknown on old Streamlit releases
+        return False
+
+
+# Write `data` to a content-hashed file (once) and return its URL. The name changes
+# whenever the content does, so the file may be cached for good, but Streamlit
+# 1.65's static handler (Starlette) only sends an ETag, no Cache-Control: browsers
+# revalidate on every use unless a proxy in front adds long-lived headers (see the
+# README). Older, Tornado-based releases do send them when the `v` argument is set.
+def publish(stem, data, extension):
+    digest = hashlib.sha1(data).hexdigest()[:12]
+    filename = f"{stem}-{digest}.{extension}"
+    path = os.path.join(GENERATED_DIR, filename)
+    if not os.path.exists(path):
+        os.makedirs(GENERATED_DIR, exist_ok=True)
+        # Write then rename so a concurrent request never reads a half-written file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return f"{STATIC_URL}/{filename}?v={digest}"
+
+
+# Drop comments and collapse whitespace; the theme CSS is mostly indentation
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)  # declarations only; no selector here uses ": "
+    return css.replace(";}", "}").strip()
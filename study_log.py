@@ -0,0 +1,184 @@
+import sys
+import threading
+
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# --- STUDY LOG BUFFER AND TOTALS (Daily Focus Tracker) ---
+# Column names shown in the "Recent Study Log" table
+DATE_COL = 'Date'
+LANGUAGE_COL = 'Language'
+DURATION_COL = 'Duration (hours)'
+# Columns of the summary views
+HOURS_COL = 'Hours'
+SESSIONS_COL = 'Sessions'
+ROLLING_COL = 'Rolling 7-day hours'
+ROLLING_DAYS = 7
+# Rows per preallocated chunk. Appends fill the newest chunk in place and only
+# allocate when it is full, so logging stays amortized O(1) per entry.
+CHUNK_SIZE = 1024
+
+
+# Rows appended in this process that the store hasn't written yet, in chunked,
+# preallocated typed columns (datetime64 dates, int language codes, float
+# durations) instead of a list of tuples or a DataFrame grown per submit.
+class StudyLog:
+    def __init__(self, chunk_size=CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        # One typed array per column per chunk
+        self._dates = []
+        self._languages = []
+        self._durations = []
+        # Languages are stored as small integer codes into this vocabulary
+        self._vocab = []
+        self._codes = {}
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def _language_code(self, language):
+        code = self._codes.get(language)
+        if code is None:
+            code = len(self._vocab)
+            self._codes[language] = code
+            self._vocab.append(language)
+        return code
+
+    def _new_chunk(self):
+        self._dates.append(np.empty(self.chunk_size, dtype='datetime64[D]'))
+        self._languages.append(np.empty(self.chunk_size, dtype=np.int32))
+        self._durations.append(np.empty(self.chunk_size, dtype=np.float64))
+
+    def append(self, day, language, duration):
+        slot = self._size % self.chunk_size
+        if slot == 0:
+            self._new_chunk()
+        self._dates[-1][slot] = np.datetime64(day, 'D')
+        self._languages[-1][slot] = self._language_code(language)
+        self._durations[-1][slot] = duration
+        self._size += 1
+
+    # Filled length of chunk i (only the newest chunk can be partial)
+    def _chunk_len(self, i):
+        if i < len(self._dates) - 1:
+            return self.chunk_size
+        return self._size - i * self.chunk_size
+
+    # All rows, oldest first, as (date, language, duration) tuples
+    def rows(self):
+        for i in range(len(self._dates)):
+            n = self._chunk_len(i)
+            yield from zip(self._dates[i][:n].astype(object).tolist(),
+                           [self._vocab[code] for code in self._languages[i][:n].tolist()],
+                           self._durations[i][:n].tolist())
+
+    # Last n rows as a DataFrame, built on demand from the newest chunks only
+    def tail(self, n=5):
+        n = min(n, self._size)
+        parts = []
+        remaining = n
+        i = len(self._dates) - 1
+        while remaining > 0:
+            filled = self._chunk_len(i)
+            take = min(remaining, filled)
+            lo = filled - take
+            parts.append((self._dates[i][lo:filled], self._languages[i][lo:filled], self._durations[i][lo:filled]))
+            remaining -= take
+            i -= 1
+        parts.reverse()
+        if parts:
+            dates, codes, durations = (np.concatenate(col) for col in zip(*parts))
+        else:
+            dates, codes, durations = (np.empty(0, dtype='datetime64[D]'), np.empty(0, dtype=np.int32),
+                                       np.empty(0, dtype=np.float64))
+        return pd.DataFrame({
+            # datetime64[D] -> datetime.date keeps the table showing plain dates
+            DATE_COL: dates.astype(object),
+            LANGUAGE_COL: pd.Categorical.from_codes(codes, categories=self._vocab),
+            DURATION_COL: durations,
+        })
+
+
+
+# Running totals over the whole study log: hours and session counts per language
+# and hours per day. Built once per process from the store, in batches, then updated on
+# every append, so the tracker's summaries never scan or group the log.
+class StudyTotals:
+    def __init__(self):
+        self._language_hours = {}
+        self._language_sessions = {}
+        self._day_hours = {}
+        self._sessions = 0
+        # Appends come from every session's script thread
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._sessions
+
+    # Approximate memory held by the totals
+    @property
+    def nbytes(self):
+        return sum(sys.getsizeof(d) for d in (self._language_hours, self._language_sessions,
+                                              self._day_hours))
+
+    def append(self, day, language, duration):
+        key = np.datetime64(day, 'D').item()
+        with self._lock:
+            self._sessions += 1
+            self._language_hours[language] = self._language_hours.get(language, 0.0) + duration
+            self._language_sessions[language] = self._language_sessions.get(language, 0) + 1
+            self._day_hours[key] = self._day_hours.get(key, 0.0) + duration
+
+    # Fold a block of rows (e.g. one batch read from the store) into the totals,
+    # with one bincount per key instead of per-row work
+    def extend(self, dates, languages, durations):
+        if not len(dates):
+            return
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        durations = np.asarray(durations, dtype=np.float64)
+        names, name_index = np.unique(np.asarray(languages, dtype=object), return_inverse=True)
+        days, day_index = np.unique(dates, return_inverse=True)
+        language_hours = np.bincount(name_index, weights=durations).tolist()
+        language_sessions = np.bincount(name_index).tolist()
+        day_hours = np.bincount(day_index, weights=durations).tolist()
+        with self._lock:
+            self._sessions += len(dates)
+            for name, h, c in zip(names.tolist(), language_hours, language_sessions):
+                self._language_hours[name] = self._language_hours.get(name, 0.0) + h
+                self._language_sessions[name] = self._language_sessions.get(name, 0) + c
+            for day, h in zip(days.tolist(), day_hours):
+                self._day_hours[day] = self._day_hours.get(day, 0.0) + h
+
+    @property
+    def total_hours(self):
+        with self._lock:
+            return sum(self._language_hours.values())
+
+    # Hours logged in the `days` days ending on `end` (inclusive), read from the daily totals
+    def hours_in_window(self, end, days=ROLLING_DAYS):
+        end = np.datetime64(end, 'D')
+        with self._lock:
+            return sum(self._day_hours.get((end - i).item(), 0.0) for i in range(days))
+
+    # Languages with at least one session, most hours first
+    def language_totals(self):
+        with self._lock:
+            rows = [(name, hours, self._language_sessions[name]) for name, hours in self._language_hours.items()]
+        rows.sort(key=lambda row: (-row[1], row[0]))
+        return pd.DataFrame(rows, columns=[LANGUAGE_COL, HOURS_COL, SESSIONS_COL]).set_index(LANGUAGE_COL)
+
+    # Hours per day for the `days` days ending on `end`, with the rolling weekly sum
+    def daily_totals(self, end, days=28):
+        end = np.datetime64(end, 'D')
+        # Pad the front so the first rows of the window already have a full week behind them
+        span = np.arange(end - (days + ROLLING_DAYS - 2), end + 1)
+        with self._lock:
+            hours = np.array([self._day_hours.get(day, 0.0) for day in span.tolist()])
+        rolling = np.convolve(hours, np.ones(ROLLING_DAYS))[:len(hours)]
+        return pd.DataFrame(
+            {HOURS_COL: hours[-days:], ROLLING_COL: rolling[-days:]},
+            index=pd.Index(span[-days:].astype(object), name=DATE_COL),
+        )
@@ -0,0 +1,65 @@
+import csv
+import importlib.util
+import io
+
+from study_log import DATE_COL, LANGUAGE_COL, DURATION_COL
+
+# --- STUDY LOG EXPORT (CSV / Parquet) ---
+# Exports read the store one batch at a time, so building one never holds more
+# than a batch of rows besides the output itself. Parquet needs pyarrow, which is
+# optional and only imported when a Parquet export is actually written.
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+# CSV bytes, one block per batch read from the store (the header comes first)
+def iter_csv(store):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow([DATE_COL, LANGUAGE_COL, DURATION_COL])
+    for days, languages, durations in store.iter_batches():
+        writer.writerows(zip(days, languages, durations))
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():  # empty log: header only
+        yield buffer.getvalue().encode("utf-8")
+
+
+def write_csv(store, f):
+    for block in iter_csv(store):
+        f.write(block)
+
+
+# One Parquet row group per batch; languages are dictionary-encoded
+def write_parquet(store, f):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        (DATE_COL, pa.date32()),
+        (LANGUAGE_COL, pa.dictionary(pa.int32(), pa.string())),
+        (DURATION_COL, pa.float64()),
+    ])
+    with pq.ParquetWriter(f, schema) as writer:
+        for days, languages, durations in store.iter_batches():
+            writer.write_batch(pa.record_batch([
+                pa.array(days, type=pa.string()).cast(pa.date32()),
+                pa.array(languages, type=pa.string()).dictionary_encode(),
+                pa.array(durations, type=pa.float64()),
+            ], schema=schema))
+
+
+# Format -> (writer, file name, MIME type)
+EXPORT_FORMATS = {"CSV": (write_csv, "study_log.csv", "text/csv")}
+if PARQUET_AVAILABLE:
+    EXPORT_FORMATS["Parquet"] = (write_parquet, "study_log.parquet", "application/vnd.apache.parquet")
+
+
+# The whole export as a file object, for a deferred download: Streamlit calls this
+# only when the download button is clicked
+def export_study_log(store, fmt):
+    write, _, _ = EXPORT_FORMATS[fmt]
+    buffer = io.BytesIO()
+    write(store, buffer)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,213 @@
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date
+
+from lazy import lazy_import
+from study_log import DATE_COL, LANGUAGE_COL, DURATION_COL, StudyLog, StudyTotals
+
+pd = lazy_import("pandas")
+
+# --- STUDY LOG PERSISTENCE ---
+# The backend is picked with a URL so other stores can be plugged in later:
+#   sqlite:///path/to/file.db   (default, local file in WAL mode)
+#   memory://                   (process-local, nothing survives a restart)
+DEFAULT_STUDY_LOG_URL = "sqlite:///" + os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "study_log.db")
+STUDY_LOG_URL = os.environ.get("STUDY_LOG_URL", DEFAULT_STUDY_LOG_URL)
+
+# Form submits are buffered and written together once either limit is hit
+BATCH_SIZE = 50
+BATCH_MAX_DELAY = 2.0  # seconds
+# Rows per batch when reading the whole log (totals, exports)
+BATCH_READ_SIZE = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS study_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    day TEXT NOT NULL,
+    language TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_study_log_day ON study_log (day);
+CREATE INDEX IF NOT EXISTS idx_study_log_language ON study_log (language);
+"""
+
+logger = logging.getLogger(__name__)
+
+
+# Small fixed pool of SQLite connections shared by every session in the process
+class SQLitePool:
+    def __init__(self, path, size=4):
+        self.path = path
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(self._connect())
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+
+class SQLiteStudyLogBackend:
+    def __init__(self, path, pool_size=4):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.pool = SQLitePool(path, pool_size)
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA)
+
+    # rows: iterable of (date, language, duration)
+    def write_many(self, rows):
+        with self.pool.connection() as conn, conn:
+            conn.executemany(
+                "INSERT INTO study_log (day, language, duration) VALUES (?, ?, ?)",
+                [(day.isoformat(), language, duration) for day, language, duration in rows],
+            )
+
+    # Newest `limit` rows (oldest first), served by the primary key index
+    def recent(self, limit):
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT day, language, duration FROM study_log ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [(date.fromisoformat(day), language, duration) for day, language, duration in reversed(rows)]
+
+    # Whole log, oldest first, as (days, languages, durations) column lists of at
+    # most `batch_size` rows each; days are ISO date strings
+    def iter_batches(self, batch_size=BATCH_READ_SIZE):
+        with self.pool.connection() as conn:
+            cursor = conn.execute("SELECT day, language, duration FROM study_log ORDER BY id")
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield tuple(map(list, zip(*rows)))
+
+    def close(self):
+        self.pool.close()
+
+
+class MemoryStudyLogBackend:
+    def __init__(self):
+        self._rows = []
+        self._lock = threading.Lock()
+
+    def write_many(self, rows):
+        with self._lock:
+            self._rows.extend(rows)
+
+    def recent(self, limit):
+        with self._lock:
+            return list(self._rows[-limit:]) if limit else []
+
+    def iter_batches(self, batch_size=BATCH_READ_SIZE):
+        with self._lock:
+            rows = list(self._rows)
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            yield ([day.isoformat() for day, _, _ in batch],
+                   [language for _, language, _ in batch],
+                   [duration for _, _, duration in batch])
+
+    def close(self):
+        pass
+
+
+def open_backend(url=STUDY_LOG_URL):
+    if url.startswith("sqlite:///"):
+        return SQLiteStudyLogBackend(url[len("sqlite:///"):])
+    if url.startswith("memory://"):
+        return MemoryStudyLogBackend()
+    raise ValueError(f"Unsupported study log backend URL: {url!r}")
+
+
+# Write-behind buffer in front of a backend, shared by every session. Submits
+# land in one pending StudyLog and are written in a single transaction per batch;
+# reads merge the pending rows so a session always sees its own entry
+# immediately. `totals` keeps the tracker's summaries: built from the backend
+# once per process, then updated on every append. (Rows other replicas write
+# show up in `recent` right away and in the totals after a restart.)
+class StudyLogStore:
+    def __init__(self, backend, batch_size=BATCH_SIZE, max_delay=BATCH_MAX_DELAY):
+        self.backend = backend
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self._pending = StudyLog()
+        self._lock = threading.Lock()
+        self._timer = None
+        self.totals = StudyTotals()
+        for batch in backend.iter_batches():
+            self.totals.extend(*batch)
+        atexit.register(self.flush)
+
+    def _schedule_flush(self):
+        if self._timer is None:
+            self._timer = threading.Timer(self.max_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def append(self, day, language, duration):
+        with self._lock:
+            self._pending.append(day, language, duration)
+            full = len(self._pending) >= self.batch_size
+            if not full:
+                self._schedule_flush()
+        self.totals.append(day, language, duration)
+        if full:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, StudyLog()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            # Written under the lock so batches reach the backend in submit order
+            if len(batch):
+                try:
+                    self.backend.write_many(list(batch.rows()))
+                except Exception:
+                    # Keep the batch (ahead of newer rows) and retry on the next flush
+                    logger.exception("Study log write of %d rows failed; will retry", len(batch))
+                    for row in self._pending.rows():
+                        batch.append(*row)
+                    self._pending = batch
+                    self._schedule_flush()
+
+    def count(self):
+        return len(self.totals)
+
+    # Newest `limit` rows (oldest first) as a DataFrame for the Recent Study Log table
+    def recent(self, limit=5):
+        with self._lock:
+            pending = self._pending.tail(limit)
+            stored = self.backend.recent(limit - len(pending)) if len(pending) < limit else []
+        if not stored:
+            return pending
+        stored = pd.DataFrame(stored, columns=[DATE_COL, LANGUAGE_COL, DURATION_COL])
+        if not len(pending):
+            return stored
+        return pd.concat([stored, pending.astype({LANGUAGE_COL: object})], ignore_index=True)
+
+    # Whole log in batches (see the backends' iter_batches), pending rows included
+    def iter_batches(self, batch_size=BATCH_READ_SIZE):
+        self.flush()
+        return self.backend.iter_batches(batch_size)
@@ -0,0 +1,36 @@
+import html
+from functools import lru_cache
+
+# --- TIMELINE COMPONENT ---
+TIMELINE_PAGE_SIZE = 25  # events per page once a timeline gets long
+
+
+def page_count(n_events, page_size=TIMELINE_PAGE_SIZE):
+    return max(1, -(-n_events // page_size))
+
+
+# Escape the event text and wrap each highlighted phrase in <strong>
+def _styled_event(event, highlights):
+    styled = html.escape(event)
+    for phrase in highlights:
+        escaped = html.escape(phrase)
+        styled = styled.replace(escaped, f"<strong>{escaped}</strong>")
+    return styled
+
+
+# One page of the timeline as a single HTML block (year column + event column per row).
+# `events` is a tuple of (year, event, highlights) tuples so pages can be cached.
+@lru_cache(maxsize=128)
+def render_timeline_html(events, year_color, event_color, page=0, page_size=TIMELINE_PAGE_SIZE):
+    rows = []
+    for year, event, highlights in events[page * page_size:(page + 1) * page_size]:
+        rows.append(
+            f"<div style='font-size: 1.75rem; font-weight: 700; color: {year_color};'>{html.escape(year)}</div>"
+            f"<p style='color: {event_color}; font-size: 1.1rem; padding-top: 10px; line-height: 1.6; margin: 0;'>"
+            f"{_styled_event(event, highlights)}</p>"
+        )
+    return (
+        "<div style='display: grid; grid-template-columns: 1fr 4fr; column-gap: 2rem; row-gap: 2.5rem; align-items: start;'>"
+        + "".join(rows)
+        + "</div>"
+    )
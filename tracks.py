@@ -0,0 +1,177 @@
+import csv
+import io
+import os
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# --- WALK TRACK IMPORT (GPX / CSV) ---
+EARTH_RADIUS_M = 6_371_008.8
+# Points are buffered in fixed-size blocks while parsing, so memory stays bounded
+# by the block size plus the compact arrays, whatever the size of the upload.
+PARSE_BLOCK = 8192
+
+# Accepted CSV header names (case-insensitive)
+LAT_NAMES = ("lat", "latitude")
+LON_NAMES = ("lon", "lng", "long", "longitude")
+TIME_NAMES = ("time", "timestamp", "datetime")
+
+
+def _parse_time(value):
+    if not value:
+        return np.nan
+    value = value.strip()
+    try:
+        return float(value)  # already epoch seconds
+    except ValueError:
+        pass
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+# Collects (lat, lon, time) points in fixed-size NumPy blocks
+class _PointBuffer:
+    def __init__(self):
+        self._block = np.empty((PARSE_BLOCK, 3), dtype=np.float64)
+        self._fill = 0
+        self._blocks = []
+
+    def add(self, lat, lon, timestamp):
+        self._block[self._fill] = (lat, lon, timestamp)
+        self._fill += 1
+        if self._fill == PARSE_BLOCK:
+            self._blocks.append(self._block)
+            self._block = np.empty((PARSE_BLOCK, 3), dtype=np.float64)
+            self._fill = 0
+
+    def finish(self):
+        return np.concatenate(self._blocks + [self._block[:self._fill]])
+
+
+# Streams <trkpt>/<rtept> elements, detaching each one from its parent once read
+def parse_gpx(stream):
+    points = _PointBuffer()
+    open_elements = []
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            open_elements.append(elem)
+            continue
+        open_elements.pop()
+        if elem.tag.rsplit("}", 1)[-1] not in ("trkpt", "rtept"):
+            continue
+        timestamp = np.nan
+        for child in elem:
+            if child.tag.rsplit("}", 1)[-1] == "time":
+                timestamp = _parse_time(child.text)
+        points.add(float(elem.get("lat")), float(elem.get("lon")), timestamp)
+        if open_elements:
+            open_elements[-1].remove(elem)
+    return points.finish()
+
+
+def parse_csv(stream):
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="") if isinstance(stream.read(0), bytes) else stream
+    reader = csv.reader(text)
+    header = [name.strip().lower() for name in next(reader)]
+
+    def column(names, required=True):
+        for name in names:
+            if name in header:
+                return header.index(name)
+        if required:
+            raise ValueError(f"CSV track needs one of the columns: {', '.join(names)}")
+        return None
+
+    lat_i, lon_i, time_i = column(LAT_NAMES), column(LON_NAMES), column(TIME_NAMES, required=False)
+    points = _PointBuffer()
+    for row in reader:
+        if not row:
+            continue
+        timestamp = _parse_time(row[time_i]) if time_i is not None else np.nan
+        points.add(float(row[lat_i]), float(row[lon_i]), timestamp)
+    return points.finish()
+
+
+# (n, 3) array of lat, lon, epoch seconds (NaN when the file has no times).
+# Any malformed input is reported as ValueError.
+def parse_track(name, stream):
+    extension = os.path.splitext(name)[1].lower()
+    try:
+        if extension == ".gpx":
+            return parse_gpx(stream)
+        if extension == ".csv":
+            return parse_csv(stream)
+    except (ET.ParseError, IndexError, TypeError, StopIteration) as exc:
+        raise ValueError(f"Malformed track file {name}: {exc}") from exc
+    raise ValueError(f"Unsupported track file: {name}")
+
+
+# All walks in three flat float64 arrays plus offsets (walk i is rows
+# offsets[i]:offsets[i+1]) instead of per-point Python objects. It holds only
+# a list and arrays, so it pickles as is when an idle session is spilled.
+class TrackStore:
+    def __init__(self):
+        self.names = []
+        self.lat = np.empty(0, dtype=np.float64)
+        self.lon = np.empty(0, dtype=np.float64)
+        self.time = np.empty(0, dtype=np.float64)
+        self.offsets = np.zeros(1, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def nbytes(self):
+        return self.lat.nbytes + self.lon.nbytes + self.time.nbytes + self.offsets.nbytes
+
+    def add_many(self, walks):
+        walks = [(name, points) for name, points in walks if len(points)]
+        if not walks:
+            return
+        self.names.extend(name for name, _ in walks)
+        arrays = [points for _, points in walks]
+        self.lat = np.concatenate([self.lat] + [p[:, 0] for p in arrays])
+        self.lon = np.concatenate([self.lon] + [p[:, 1] for p in arrays])
+        self.time = np.concatenate([self.time] + [p[:, 2] for p in arrays])
+        lengths = np.array([len(p) for p in arrays], dtype=np.int64)
+        self.offsets = np.concatenate([self.offsets, self.offsets[-1] + np.cumsum(lengths)])
+
+    # [[lon, lat], ...] path of walk i for pydeck, thinned to at most max_points
+    def path(self, i, max_points=500):
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        stride = max(1, -(-(hi - lo) // max_points))
+        index = np.arange(lo, hi, stride)
+        return np.column_stack([self.lon[index], self.lat[index]]).tolist()
+
+    # Distance (km), duration (min) and pace (min/km) for every walk at once
+    def summary(self):
+        n_walks = len(self.names)
+        if n_walks == 0:
+            return {"Walk": [], "Points": [], "Distance (km)": [], "Duration (min)": [], "Pace (min/km)": []}
+        lat = np.radians(self.lat)
+        lon = np.radians(self.lon)
+        # Haversine between consecutive points; the step that crosses from one
+        # walk into the next is masked out before summing per walk.
+        dlat = np.diff(lat)
+        dlon = np.diff(lon)
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(dlon / 2) ** 2
+        step = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+        lengths = np.diff(self.offsets)
+        point_walk = np.repeat(np.arange(n_walks), lengths)
+        same_walk = point_walk[:-1] == point_walk[1:]
+        distance = np.bincount(point_walk[:-1][same_walk], weights=step[same_walk], minlength=n_walks)
+
+        starts, ends = self.offsets[:-1], self.offsets[1:] - 1
+        with np.errstate(invalid="ignore"):
+            duration = np.maximum(self.time[ends] - self.time[starts], 0) / 60
+            km = distance / 1000
+            pace = np.where(km > 0, duration / np.where(km > 0, km, 1), np.nan)
+        return {
+            "Walk": list(self.names),
+            "Points": lengths.tolist(),
+            "Distance (km)": np.round(km, 2).tolist(),
+            "Duration (min)": np.round(duration, 1).tolist(),
+            "Pace (min/km)": np.round(pace, 1).tolist(),
+        }